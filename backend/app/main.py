@@ -12,6 +12,7 @@ from app.routes import (
     websocket
 )
 from app.services.chat_service import ChatService
+from app.utils.response_validator import get_response_validator
 from contextlib import asynccontextmanager
 from datetime import datetime
 import logging
@@ -79,6 +80,10 @@ async def lifespan(app: FastAPI):
         if chat_service:
             await chat_service.cleanup()
             logger.info("Chat service cleaned up")
+
+        # Release the shared validator's scan pool
+        await get_response_validator().cleanup()
+        logger.info("Response validator cleaned up")
         
         # Cleanup database connections
         await DatabaseConfig.cleanup()
@@ -255,5 +260,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
+        loop="auto",  # uvloop where installed, stock asyncio on Windows
         log_level="info"
     )
\ No newline at end of file
@@ -10,7 +10,7 @@ from app.models.consultation import (
 from app.config.database import DatabaseConfig, consultations_collection, redis_client
 from app.services.chat_service import ChatService
 from app.utils.speech_processor import SpeechProcessor, ProcessedSpeech
-from app.utils.response_validator import AIResponseValidator
+from app.utils.response_validator import get_response_validator
 from app.config.language_metadata import LanguageMetadata
 from datetime import datetime
 import logging
@@ -26,7 +26,7 @@ router = APIRouter()
 # Initialize services
 chat_service = ChatService()
 speech_processor = SpeechProcessor()
-response_validator = AIResponseValidator()
+response_validator = get_response_validator()
 
 # Resource management
 consultation_semaphore = asyncio.Semaphore(20)
@@ -9,7 +9,7 @@ import asyncio
 import json
 from app.utils.speech_processor import SpeechProcessor, ProcessedSpeech
 from app.config.language_metadata import LanguageMetadata
-from app.utils.response_validator import AIResponseValidator
+from app.utils.response_validator import get_response_validator
 from app.config.database import redis_client, consultations_collection 
 from app.routes.consultation import consultation_manager
 from app.routes.websocket import manager, WebSocketMessage, WebSocketResponse, WebSocketDisconnect 
@@ -21,7 +21,7 @@ router = APIRouter()
 
 # Initialize services
 speech_processor = SpeechProcessor()
-response_validator = AIResponseValidator()
+response_validator = get_response_validator()
 
 class SpeechRequest(BaseModel):
     """Model for speech processing requests"""
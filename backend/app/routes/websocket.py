@@ -5,11 +5,12 @@ from typing import Dict, Optional, Set, List, Any
 import logging
 from datetime import datetime, date
 import json
+import orjson
 from pydantic import BaseModel, Field, validator
 import base64
 from app.utils.speech_processor import SpeechProcessor, ProcessedSpeech
 from app.services.chat_service import ChatService
-from app.utils.response_validator import AIResponseValidator
+from app.utils.response_validator import get_response_validator
 from app.config.language_metadata import LanguageMetadata
 from app.config.database import redis_client, DatabaseConfig, consultations_collection
 from app.utils.serializers import StreamingStateSerializer
@@ -126,7 +127,7 @@ class ConnectionManager:
         self.session_manager = SessionManager(redis_client)
         self.speech_processor = SpeechProcessor()
         self.chat_service = ChatService()
-        self.response_validator = AIResponseValidator()
+        self.response_validator = get_response_validator()
 
         # Database clients
         self.db_config = None
@@ -243,12 +244,13 @@ class ConnectionManager:
             
             # Use serializer for streaming state
             streaming_state = StreamingStateSerializer.serialize(
-                state.streaming_state.model_dump()
+                state.streaming_state.model_dump(),
+                in_place=True
             )
             
             session_data = {
                 "language_preferences": state.language_preferences,
-                "last_activity": state.last_activity.isoformat(),
+                "last_activity": state.last_activity,
                 "message_count": state.message_count,
                 "streaming_state": streaming_state,
                 "user_details": state.user_details,
@@ -258,7 +260,7 @@ class ConnectionManager:
             await self.redis_client.setex(
                 cache_key,
                 self.cache_ttl,
-                json.dumps(session_data)
+                orjson.dumps(session_data)
             )
             
             logger.debug("Session cached", extra={"session_id": session_id})
@@ -960,56 +962,6 @@ class ConnectionManager:
             logger.error(f"Cleanup error: {str(e)}")
 
 
-    # In websocket.py - modify existing _cache_session_data method
-    async def _cache_session_data(self, session_id: str, state: ConnectionState):
-        """Cache session data in Redis with proper error handling"""
-        try:
-            if not self.redis_client:
-                await self.initialize()
-                if not self.redis_client:
-                    raise RuntimeError("Redis client unavailable - critical for session management")
-                    
-            cache_key = f"{self.redis_prefix}session:{session_id}"
-            
-            # Convert streaming state to dict and handle bytes buffer
-            streaming_state = state.streaming_state.model_dump()
-            # Remove or encode bytes buffer
-            if 'buffer' in streaming_state:
-                streaming_state['buffer'] = base64.b64encode(streaming_state['buffer']).decode() if streaming_state['buffer'] else ""
-            
-            if streaming_state.get('start_time'):
-                streaming_state['start_time'] = streaming_state['start_time'].isoformat()
-            
-            session_data = {
-                "language_preferences": state.language_preferences,
-                "last_activity": state.last_activity.isoformat(),
-                "message_count": state.message_count,
-                "streaming_state": streaming_state,
-                "user_details": state.user_details,
-                "context_id": state.context_id
-            }
-            
-            # Cache with proper error handling
-            await self.redis_client.setex(
-                cache_key,
-                self.cache_ttl,
-                json.dumps(session_data)
-            )
-            
-            logger.debug(
-                f"Session cached successfully: {session_id}",
-                extra={"session_id": session_id}
-            )
-                
-        except Exception as e:
-            logger.error(
-                f"Critical: Session cache error for {session_id}: {str(e)}",
-                exc_info=True,
-                extra={"session_id": session_id}
-            )
-            raise RuntimeError(f"Session caching failed: {str(e)}")
-
-
     async def cleanup_session(self, session_id: str):
         """Cleanup session data with proper validation"""
         try:
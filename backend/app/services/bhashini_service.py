@@ -1,5 +1,5 @@
 # backend/app/services/translation_service/bhashini_service.py
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Union
 import aiohttp
 import json
 import os
@@ -233,7 +233,7 @@ class BhashiniService:
 
     async def speech_to_text(
         self,
-        audio_data: bytes,
+        audio_data: Union[bytes, memoryview],
         source_language: str,
         auto_detect: bool = False
     ) -> Dict:
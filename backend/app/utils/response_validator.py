@@ -3,14 +3,107 @@ from typing import Dict, List, Optional, Tuple
 import re
 import logging
 from datetime import datetime
+from functools import lru_cache
 from pydantic import BaseModel
-from app.config.database import redis_client, translations_cache
+from cachetools import TTLCache
+from app.config.database import DatabaseConfig, translations_cache
 from app.config.language_metadata import LanguageMetadata
-import json
 import asyncio
+import hashlib
+import orjson
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    # regex releases the GIL while matching, so threaded scans run in parallel
+    import regex as re_engine
+except ImportError:
+    import re as re_engine
 
 logger = logging.getLogger(__name__)
 
+# Confidence/recommendation markers stripped from responses
+_CLEAN_RE = re_engine.compile(r'\[(?:Confidence|Recommendation):[^\]\n]*\]')
+
+# Placeholders standing in for preserved medical terms during translation
+_PLACEHOLDER_RE = re.compile(r'__MEDICAL_TERM_\d+__')
+
+_CONFIDENCE_PATTERN = r'\[(?:Confidence|विश्वास|விசுவாசம்):\s*(\d+)%\]'
+_CONFIDENCE_RE = re_engine.compile(_CONFIDENCE_PATTERN)
+
+# Keyword alternations per pattern type and language
+_BASE_PATTERNS = {
+    'symptoms': {
+        'en': r'symptom|pain|discomfort|feeling|condition',
+        'hi': r'लक्षण|दर्द|तकलीफ़|महसूस|स्थिति',
+        # Add patterns for other languages
+    },
+    'emergency': {
+        'en': r'emergency|immediate|urgent|serious|severe',
+        'hi': r'आपातकालीन|तत्काल|गंभीर|जरूरी',
+        # Add patterns for other languages
+    },
+    'medical': {
+        'en': r'diagnosis|treatment|medication|prescription',
+        'hi': r'निदान|इलाज|दवा|पर्चा',
+        # Add patterns for other languages
+    }
+}
+
+def _has_case(text: str) -> bool:
+    """Check whether any character in text has upper/lower case forms"""
+    return text.lower() != text.upper()
+
+@lru_cache(maxsize=64)
+def _get_base_pattern(language: str, pattern_type: str) -> str:
+    """Get regex pattern for specific language and type"""
+    patterns = _BASE_PATTERNS[pattern_type]
+    return patterns.get(language, patterns['en'])
+
+def _build_language_patterns(lang_code: str) -> Dict:
+    """Compile validation patterns for a single language"""
+    symptoms = _get_base_pattern(lang_code, 'symptoms')
+    emergency = _get_base_pattern(lang_code, 'emergency')
+    medical = _get_base_pattern(lang_code, 'medical')
+
+    # Case-insensitive matching only where the script has case
+    is_cased = _has_case(emergency + medical)
+    flags = re.IGNORECASE if is_cased else 0
+    keyword_group = r'(?i:{})' if is_cased else r'(?:{})'
+
+    return {
+        'symptom_mention': re.compile(
+            symptoms,
+            re.IGNORECASE if _has_case(symptoms) else 0
+        ),
+        'confidence_score': _CONFIDENCE_RE,
+        'emergency_keywords': re.compile(emergency, flags),
+        'medical_terms': re.compile(medical, flags),
+        # Single-pass scanner; dispatch on the matched group name
+        'combined': re_engine.compile(
+            r'(?P<conf>\[(?:Confidence|विश्वास|விசுவாசம்):\s*(?P<conf_value>\d+)%\])'
+            r'|(?P<emerg>' + keyword_group.format(emergency) + r')'
+            r'|(?P<med>' + keyword_group.format(medical) + r')'
+            r'|(?P<confmark>\[Confidence:[^\]\n]*\])'
+            r'|(?P<recmark>\[Recommendation:[^\]\n]*\])'
+        ),
+        # Plain keywords for a cheap substring check before scanning
+        'emerg_probe': tuple(emergency.split('|')),
+        'med_probe': tuple(medical.split('|')),
+        'is_cased': is_cased
+    }
+
+# Compiled once at import; languages without their own keywords share English
+_COMPILED_PATTERNS = {
+    lang_code: _build_language_patterns(lang_code)
+    for lang_code in set().union(*_BASE_PATTERNS.values())
+}
+_LANG_PATTERNS: Dict[str, Dict] = {
+    lang_code: _COMPILED_PATTERNS.get(lang_code, _COMPILED_PATTERNS['en'])
+    for lang_code in LanguageMetadata.get_supported_languages()
+}
+
 class ValidationResult(BaseModel):
     """Model for validation results"""
     is_valid: bool
@@ -29,54 +122,49 @@ class AIResponseValidator:
         
         # Cache settings
         self.cache_duration = 3600  # 1 hour
+        # In-process tier in front of Redis for hot translations
+        self._local_tx_cache = TTLCache(maxsize=4096, ttl=self.cache_duration)
         self.validation_patterns = self._load_validation_patterns()
         
-        # Concurrent validation limit
-        self.validation_semaphore = asyncio.Semaphore(10)
+        # Concurrency limits: a wide one for Redis/translation I/O and a
+        # bounded pool for CPU-bound scans of large responses
+        self.io_semaphore = asyncio.Semaphore(64)
+        self.thread_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
         
         # Emergency detection threshold
         self.emergency_threshold = 0.8
+
+        # Responses longer than this are scanned off the event loop
+        self.offload_threshold = 16384  # characters
+        
+        # Redis client, resolved lazily by _get_redis
+        self._redis = None
+        self._redis_retry_at = 0.0
+        self.redis_retry_interval = 30  # seconds
         
         # Initialize language-specific patterns
         self._initialize_language_patterns()
 
+    async def _get_redis(self):
+        """Redis client, resolved once on first use since it connects after import"""
+        if self._redis is None and time.monotonic() >= self._redis_retry_at:
+            try:
+                self._redis = await DatabaseConfig.get_redis()
+            except Exception as e:
+                # Caches act as misses until the next attempt
+                logger.warning(f"Redis unavailable for validation cache: {str(e)}")
+                self._redis_retry_at = time.monotonic() + self.redis_retry_interval
+        return self._redis
+
     def _initialize_language_patterns(self):
         """Initialize validation patterns for different languages"""
-        self.language_patterns = {}
-        
-        for lang_code in LanguageMetadata.get_supported_languages():
-            # Get language metadata
-            lang_meta = LanguageMetadata.get_language_metadata(lang_code)
-            
-            # Store patterns specific to each language
-            self.language_patterns[lang_code] = {
-                'symptom_mention': self._get_language_patterns(lang_code, 'symptoms'),
-                'confidence_score': r'\[(?:Confidence|विश्वास|விசுவாசம்):\s*(\d+)%\]',
-                'emergency_keywords': self._get_language_patterns(lang_code, 'emergency'),
-                'medical_terms': self._get_language_patterns(lang_code, 'medical')
-            }
+        # Shared module-level table, compiled once per process
+        self.language_patterns = _LANG_PATTERNS
 
-    def _get_language_patterns(self, language: str, pattern_type: str) -> str:
+    @staticmethod
+    def _get_language_patterns(language: str, pattern_type: str) -> str:
         """Get regex patterns for specific language and type"""
-        base_patterns = {
-            'symptoms': {
-                'en': r'symptom|pain|discomfort|feeling|condition',
-                'hi': r'लक्षण|दर्द|तकलीफ़|महसूस|स्थिति',
-                # Add patterns for other languages
-            },
-            'emergency': {
-                'en': r'emergency|immediate|urgent|serious|severe',
-                'hi': r'आपातकालीन|तत्काल|गंभीर|जरूरी',
-                # Add patterns for other languages
-            },
-            'medical': {
-                'en': r'diagnosis|treatment|medication|prescription',
-                'hi': r'निदान|इलाज|दवा|पर्चा',
-                # Add patterns for other languages
-            }
-        }
-        
-        return base_patterns[pattern_type].get(language, base_patterns[pattern_type]['en'])
+        return _get_base_pattern(language, pattern_type)
 
     def _load_validation_patterns(self) -> Dict:
         """Load and compile regex patterns"""
@@ -97,41 +185,45 @@ class AIResponseValidator:
         context: Optional[List[Dict]] = None
     ) -> Tuple[bool, str, ValidationResult]:
         """Validate and clean response with language support"""
-        async with self.validation_semaphore:
-            try:
-                # Get language-specific patterns
-                patterns = self.language_patterns.get(
-                    source_language,
-                    self.language_patterns['en']
-                )
-                
-                # Extract confidence scores
-                confidence_matches = list(re.finditer(
-                    patterns['confidence_score'],
-                    response
-                ))
-                confidence_scores = [
-                    int(match.group(1)) for match in confidence_matches
-                ]
-                
-                # Check for emergency keywords
-                emergency_matches = re.findall(
-                    patterns['emergency_keywords'],
-                    response,
-                    re.IGNORECASE
-                )
-                emergency_level = self._determine_emergency_level(
-                    emergency_matches,
-                    confidence_scores
-                )
-                
-                # Extract medical terms
-                medical_terms = re.findall(
-                    patterns['medical_terms'],
-                    response,
-                    re.IGNORECASE
-                )
-                
+        try:
+            # Get language-specific patterns
+            patterns = self.language_patterns.get(
+                source_language,
+                self.language_patterns['en']
+            )
+            
+            # Identical responses reuse the cached validation result
+            cache_key = self._get_validation_cache_key(
+                response,
+                source_language,
+                target_language,
+                context
+            )
+            validation_result = await self._get_cached_validation(cache_key)
+
+            if validation_result:
+                medical_terms = validation_result.metadata['language']['medical_terms_preserved']
+                cleaned_response = None
+            else:
+                # Extract confidence scores, emergency keywords and medical
+                # terms in one pass; large responses are scanned in the pool
+                if len(response) > self.offload_threshold:
+                    loop = asyncio.get_running_loop()
+                    scan = await loop.run_in_executor(
+                        self.thread_pool,
+                        self._scan_sync,
+                        response,
+                        patterns
+                    )
+                else:
+                    scan = self._scan_sync(response, patterns)
+                (
+                    overall_confidence,
+                    emergency_level,
+                    medical_terms,
+                    cleaned_response
+                ) = scan
+            
                 # Validate medical content
                 medical_validation = await self._validate_medical_content(
                     response,
@@ -139,7 +231,7 @@ class AIResponseValidator:
                     source_language,
                     context
                 )
-                
+            
                 # Structure the validation result
                 validation_result = ValidationResult(
                     is_valid=medical_validation['is_valid'],
@@ -148,7 +240,7 @@ class AIResponseValidator:
                     emergency_level=emergency_level,
                     improvement_needed=medical_validation['needs_improvement'],
                     confidence_scores={
-                        'overall': sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0,
+                        'overall': overall_confidence,
                         'medical_terms': medical_validation['confidence'],
                         'language': medical_validation['language_confidence']
                     },
@@ -162,28 +254,204 @@ class AIResponseValidator:
                         'validation_timestamp': datetime.utcnow().isoformat()
                     }
                 )
-                
-                # Handle translations if needed
-                if target_language and target_language != source_language:
-                    processed_response = await self._handle_translation(
-                        response,
-                        source_language,
-                        target_language,
-                        medical_terms,
-                        validation_result
-                    )
-                else:
-                    processed_response = self._clean_response(response)
-                
-                return (
-                    validation_result.is_valid,
-                    "",
-                    processed_response
+
+                await self._cache_validation(cache_key, validation_result)
+
+            # Handle translations if needed
+            if target_language and target_language != source_language:
+                processed_response = await self._handle_translation(
+                    response,
+                    source_language,
+                    target_language,
+                    medical_terms,
+                    validation_result
                 )
+            elif cleaned_response is not None:
+                processed_response = cleaned_response
+            else:
+                processed_response = self._clean_response(response)
+            
+            return (
+                validation_result.is_valid,
+                "",
+                processed_response
+            )
 
-            except Exception as e:
-                logger.error(f"Error validating response: {str(e)}")
-                return False, str(e), {}
+        except Exception as e:
+            logger.error(f"Error validating response: {str(e)}")
+            return False, str(e), {}
+
+    def _get_validation_cache_key(
+        self,
+        response: str,
+        source_language: str,
+        target_language: Optional[str],
+        context: Optional[List[Dict]] = None
+    ) -> str:
+        """Generate cache key for a validation result"""
+        digest = hashlib.blake2b(response.encode(), digest_size=16)
+        # Context feeds the consistency check, so it is part of the key
+        if context:
+            digest.update(b"\0")
+            digest.update(orjson.dumps(context, default=str, option=orjson.OPT_SORT_KEYS))
+        return f"val:{digest.hexdigest()}:{source_language}:{target_language or ''}"
+
+    async def _get_cached_validation(self, cache_key: str) -> Optional[ValidationResult]:
+        """Get cached validation result from Redis"""
+        redis = await self._get_redis()
+        if not redis:
+            return None
+        try:
+            async with self.io_semaphore:
+                cached = await redis.get(cache_key)
+            if cached:
+                return ValidationResult(**orjson.loads(cached))
+        except Exception as e:
+            logger.warning(f"Validation cache read error: {str(e)}")
+        return None
+
+    async def _cache_validation(
+        self,
+        cache_key: str,
+        validation_result: ValidationResult
+    ) -> None:
+        """Cache validation result in Redis"""
+        redis = await self._get_redis()
+        if not redis:
+            return
+        try:
+            async with self.io_semaphore:
+                await redis.set(
+                    cache_key,
+                    orjson.dumps(validation_result.dict()),
+                    ex=self.cache_duration
+                )
+        except Exception as e:
+            logger.warning(f"Validation cache write error: {str(e)}")
+
+    def _get_translation_cache_key(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str
+    ) -> str:
+        """Generate Redis cache key for a translated response"""
+        text_hash = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+        return f"val_translation:{source_language}:{target_language}:{text_hash}"
+
+    async def _get_cached_translation(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str
+    ) -> Optional[str]:
+        """Get translation from the local cache, falling back to Redis"""
+        local_key = (text, source_language, target_language)
+        cached = self._local_tx_cache.get(local_key)
+        if cached is not None:
+            return cached
+
+        redis = await self._get_redis()
+        if not redis:
+            return None
+        try:
+            async with self.io_semaphore:
+                cached = await redis.get(
+                    self._get_translation_cache_key(text, source_language, target_language)
+                )
+            if cached:
+                self._local_tx_cache[local_key] = cached
+                return cached
+        except Exception as e:
+            logger.warning(f"Translation cache read error: {str(e)}")
+        return None
+
+    async def _cache_translation(
+        self,
+        text: str,
+        translated_text: str,
+        source_language: str,
+        target_language: str
+    ) -> None:
+        """Cache translation in both the local cache and Redis"""
+        self._local_tx_cache[(text, source_language, target_language)] = translated_text
+
+        redis = await self._get_redis()
+        if not redis:
+            return
+        try:
+            async with self.io_semaphore:
+                await redis.set(
+                    self._get_translation_cache_key(text, source_language, target_language),
+                    translated_text,
+                    ex=self.cache_duration
+                )
+        except Exception as e:
+            logger.warning(f"Translation cache write error: {str(e)}")
+
+    def _scan_sync(
+        self,
+        response: str,
+        patterns: Dict
+    ) -> Tuple[float, str, List[str], str]:
+        """Scan response once for scores, keywords, terms and markers"""
+        # Most replies have no markers or keywords; skip the regex entirely
+        if '[' not in response:
+            # Fold case once; caseless scripts are probed as-is
+            haystack = response.casefold() if patterns['is_cased'] else response
+            if not (
+                any(k in haystack for k in patterns['emerg_probe'])
+                or any(k in haystack for k in patterns['med_probe'])
+            ):
+                return 0, "none", [], response.strip()
+
+        # Running totals instead of match lists
+        confidence_sum = 0
+        confidence_count = 0
+        emergency_count = 0
+        medical_terms = []
+        cleaned_parts = []
+        last_end = 0
+
+        for match in patterns['combined'].finditer(response):
+            group = match.lastgroup
+            if group == 'conf':
+                confidence_sum += int(match.group('conf_value'))
+                confidence_count += 1
+                # Only English confidence markers are stripped
+                if not match.group().startswith('[Confidence:'):
+                    continue
+            elif group == 'emerg':
+                emergency_count += 1
+                continue
+            elif group == 'med':
+                medical_terms.append(match.group())
+                continue
+            elif group in ('confmark', 'recmark'):
+                # Keywords inside stripped markers still count
+                marker = match.group()
+                emergency_count += len(
+                    patterns['emergency_keywords'].findall(marker)
+                )
+                medical_terms.extend(patterns['medical_terms'].findall(marker))
+
+            # Drop confidence/recommendation markers from the cleaned text
+            cleaned_parts.append(response[last_end:match.start()])
+            last_end = match.end()
+
+        cleaned_parts.append(response[last_end:])
+        cleaned = ''.join(cleaned_parts).strip()
+
+        emergency_level = self._determine_emergency_level(
+            emergency_count,
+            confidence_sum,
+            confidence_count
+        )
+        overall_confidence = (
+            confidence_sum / confidence_count if confidence_count else 0
+        )
+
+        return overall_confidence, emergency_level, medical_terms, cleaned
 
     async def _validate_medical_content(
         self,
@@ -194,9 +462,6 @@ class AIResponseValidator:
     ) -> Dict:
         """Validate medical content in response"""
         try:
-            # Get language metadata
-            lang_meta = LanguageMetadata.get_language_metadata(language)
-            
             # Initialize validation result
             validation = {
                 'is_valid': True,
@@ -221,7 +486,14 @@ class AIResponseValidator:
                 
                 # Check if medical terms should be preserved
                 if LanguageMetadata.should_preserve_medical_terms(language):
-                    validation['preserved_terms'].extend(medical_terms)
+                    # Unique terms, longest first so substrings never clobber
+                    # multi-word terms during placeholder substitution
+                    unique_terms = sorted(
+                        dict.fromkeys(medical_terms),
+                        key=len,
+                        reverse=True
+                    )
+                    validation['preserved_terms'].extend(unique_terms)
             
             # Check for context consistency
             if context:
@@ -269,19 +541,20 @@ class AIResponseValidator:
 
     def _determine_emergency_level(
         self,
-        emergency_matches: List[str],
-        confidence_scores: List[int]
+        emergency_count: int,
+        confidence_sum: int,
+        confidence_count: int
     ) -> str:
         """Determine emergency level of response"""
-        if not emergency_matches:
+        if not emergency_count:
             return "none"
             
         # Calculate emergency score
-        emergency_score = len(emergency_matches) / 10  # Normalize
+        emergency_score = emergency_count / 10  # Normalize
         
         # Factor in confidence scores
-        if confidence_scores:
-            avg_confidence = sum(confidence_scores) / len(confidence_scores)
+        if confidence_count:
+            avg_confidence = confidence_sum / confidence_count
             emergency_score *= (avg_confidence / 100)
         
         if emergency_score >= self.emergency_threshold:
@@ -299,6 +572,10 @@ class AIResponseValidator:
         validation_result: ValidationResult
     ) -> str:
         """Handle translation while preserving medical terms"""
+        # Nothing to send to the translation backend
+        if not text.strip():
+            return text
+
         try:
             # Check cache first
             cached_translation = await self._get_cached_translation(
@@ -310,24 +587,21 @@ class AIResponseValidator:
             if cached_translation:
                 return cached_translation
             
-            # Preserve medical terms if needed
-            preserved_terms = {}
-            if validation_result.metadata['language']['medical_terms_preserved']:
-                for term in medical_terms:
-                    placeholder = f"__MEDICAL_TERM_{len(preserved_terms)}__"
-                    preserved_terms[placeholder] = term
-                    text = text.replace(term, placeholder)
-            
-            # Translate modified text
-            translated_text = await self._translate_text(
-                text,
-                source_language,
-                target_language
-            )
-            
-            # Restore preserved terms
-            for placeholder, term in preserved_terms.items():
-                translated_text = translated_text.replace(placeholder, term)
+            # Translate directly when no medical terms need preserving
+            if not (medical_terms and validation_result.metadata['language']['medical_terms_preserved']):
+                async with self.io_semaphore:
+                    translated_text = await self._translate_text(
+                        text,
+                        source_language,
+                        target_language
+                    )
+            else:
+                translated_text = await self._translate_preserving_terms(
+                    text,
+                    source_language,
+                    target_language,
+                    medical_terms
+                )
             
             # Cache translation
             await self._cache_translation(
@@ -343,13 +617,47 @@ class AIResponseValidator:
             logger.error(f"Translation error: {str(e)}")
             return text
 
+    async def _translate_preserving_terms(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str,
+        medical_terms: List[str]
+    ) -> str:
+        """Translate text with medical terms swapped out for placeholders"""
+        placeholders = {
+            term: f"__MEDICAL_TERM_{i}__"
+            for i, term in enumerate(dict.fromkeys(medical_terms))
+        }
+        preserved_terms = {v: k for k, v in placeholders.items()}
+
+        # Longest terms first so multi-word terms win over substrings
+        term_pattern = re.compile('|'.join(
+            map(re.escape, sorted(placeholders, key=len, reverse=True))
+        ))
+        protected_text = term_pattern.sub(
+            lambda m: placeholders[m.group()],
+            text
+        )
+
+        # Translate modified text
+        async with self.io_semaphore:
+            translated_text = await self._translate_text(
+                protected_text,
+                source_language,
+                target_language
+            )
+
+        # Restore preserved terms
+        return _PLACEHOLDER_RE.sub(
+            lambda m: preserved_terms.get(m.group(), m.group()),
+            translated_text
+        )
+
     def _clean_response(self, response: str) -> str:
         """Clean response text"""
-        # Remove confidence markers
-        cleaned = re.sub(r'\[Confidence:.*?\]', '', response)
-        # Remove recommendation markers
-        cleaned = re.sub(r'\[Recommendation:.*?\]', '', cleaned)
-        return cleaned.strip()
+        # Remove confidence and recommendation markers in one pass
+        return _CLEAN_RE.sub('', response).strip()
 
     async def enhance_response(
         self,
@@ -440,4 +748,13 @@ class AIResponseValidator:
         if response['recommendations']:
             enhanced += "\n\nRecommendations:\n" + "\n".join(f"• {rec}" for rec in response['recommendations'])
 
-        return enhanced
\ No newline at end of file
+        return enhanced
+
+    async def cleanup(self):
+        """Release the scan thread pool"""
+        self.thread_pool.shutdown(wait=False, cancel_futures=True)
+
+@lru_cache(maxsize=1)
+def get_response_validator() -> AIResponseValidator:
+    """Get the shared validator instance"""
+    return AIResponseValidator()
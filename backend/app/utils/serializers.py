@@ -1,22 +1,19 @@
-from datetime import datetime
-import base64
+import binascii
 from typing import Any, Dict
 
 class StreamingStateSerializer:
     @staticmethod
-    def serialize(state: Dict[str, Any]) -> Dict[str, Any]:
-        serialized = state.copy()
+    def serialize(state: Dict[str, Any], in_place: bool = False) -> Dict[str, Any]:
+        """Prepare streaming state for caching; encode the result with orjson, which handles datetimes"""
+        # Callers that own a freshly dumped state can skip the copy
+        serialized = state if in_place else {**state}
         
         # Handle bytes buffer
-        if 'buffer' in serialized:
-            serialized['buffer'] = (
-                base64.b64encode(serialized['buffer']).decode() 
-                if isinstance(serialized['buffer'], bytes) 
-                else ""
-            )
-            
-        # Handle datetime
-        if 'start_time' in serialized and isinstance(serialized['start_time'], datetime):
-            serialized['start_time'] = serialized['start_time'].isoformat()
-            
+        buffer = state.get('buffer')
+        if isinstance(buffer, bytes):
+            serialized['buffer'] = binascii.b2a_base64(buffer, newline=False).decode('ascii')
+        elif 'buffer' in state:
+            serialized['buffer'] = ""
+
+        # Datetimes are left as-is; orjson encodes them natively as ISO 8601
         return serialized
@@ -1,23 +1,51 @@
 # backend/app/utils/speech_processor.py
-from typing import Dict, List, Optional, BinaryIO, Union, Any
+from typing import Dict, Optional, Union, Any
 from fastapi import HTTPException
 from pydantic import BaseModel, Field
-from datetime import datetime
+from datetime import datetime, timedelta
+from collections import OrderedDict
+from dataclasses import dataclass, field
 import asyncio
+import contextlib
+import copy
 import logging
 import uuid
+import hashlib
+import struct
+import time
 import io
 import os
-import base64
+import random
 import numpy as np
-from concurrent.futures import ThreadPoolExecutor
 from pydub import AudioSegment
+try:
+    import soxr
+except ImportError:
+    soxr = None
 from app.config.language_metadata import LanguageMetadata
 from app.services.bhashini_service import BhashiniService
-import json
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Static language tables resolved once instead of per request
+_LANGUAGE_NAMES = LanguageMetadata.LANGUAGE_CODES
+_LANGUAGE_SCRIPTS = {
+    code: meta.get("script") for code, meta in LanguageMetadata.LANGUAGE_METADATA.items()
+}
+
+def _wav_header(audio: AudioSegment) -> bytes:
+    """Build a 44-byte PCM RIFF/WAVE header for the segment's raw data"""
+    data_size = len(audio.raw_data)
+    block_align = audio.channels * audio.sample_width
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, audio.channels, audio.frame_rate,
+        audio.frame_rate * block_align, block_align, audio.sample_width * 8,
+        b'data', data_size
+    )
+
 class AudioConfig(BaseModel):
     """Audio configuration settings"""
     sample_rate: int = Field(default=16000, description="Sample rate in Hz")
@@ -27,104 +55,176 @@ class AudioConfig(BaseModel):
     max_duration: int = Field(default=300, description="Maximum audio duration in seconds")
     min_duration: float = Field(default=0.5, description="Minimum audio duration in seconds")
 
-class ProcessedSpeech(BaseModel):
-    """Model for processed speech results following our flow"""
-    original_text: str = Field(..., description="Text in original language")
-    english_text: Optional[str] = Field(None, description="Translated English text")
+@dataclass(slots=True)
+class ProcessedSpeech:
+    """Processed speech results following our flow"""
+    original_text: str  # Text in original language
     language_code: str
     language_name: str
     confidence: float
     duration: float
     timestamp: datetime
-    metadata: Dict = {}
+    english_text: Optional[str] = None  # Translated English text
+    metadata: Dict = field(default_factory=dict)
 
 class AudioProcessor:
     """Handles core audio processing functionality"""
     def __init__(self, config: AudioConfig):
         self.config = config
-        self.thread_pool = ThreadPoolExecutor(max_workers=2)
-        self._setup_temp_directory()
-
-    def _setup_temp_directory(self):
-        """Setup temporary directory for audio processing"""
-        self.temp_dir = os.path.join(os.getcwd(), 'temp', 'audio')
-        os.makedirs(self.temp_dir, exist_ok=True)
 
-    async def validate_and_convert(self, audio_data: bytes) -> tuple[bytes, Dict]:
+    async def validate_and_convert(self, audio_data: bytes) -> tuple[Union[bytes, memoryview], Dict]:
         """Validate and convert audio to required format"""
         try:
-            # Run in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(
-                self.thread_pool,
-                self._process_audio,
-                audio_data
-            )
+            # Run in the default executor to avoid blocking
+            return await asyncio.to_thread(self._process_audio, audio_data)
         except Exception as e:
             logger.error(f"Audio processing error: {str(e)}")
             raise HTTPException(status_code=400, detail="Invalid audio data")
 
-    def _process_audio(self, audio_data: bytes) -> tuple[bytes, Dict]:
+    def _process_audio(self, audio_data: bytes) -> tuple[Union[bytes, memoryview], Dict]:
         """Process audio data synchronously"""
-        temp_path = os.path.join(self.temp_dir, f"{uuid.uuid4()}.wav")
-        try:
-            # Write audio data
-            with open(temp_path, 'wb') as f:
-                f.write(audio_data)
+        fast_path = self._passthrough_wav(audio_data)
+        if fast_path is not None:
+            return fast_path
 
-            # Load and validate audio
-            audio = AudioSegment.from_file(temp_path)
-            
-            # Validate duration
-            duration = len(audio) / 1000.0
-            if not (self.config.min_duration <= duration <= self.config.max_duration):
-                raise ValueError(f"Audio duration {duration}s out of range")
-
-            # Convert to required format
-            audio = self._convert_audio(audio)
-
-            # Get audio metadata
-            metadata = {
-                'duration': duration,
-                'sample_rate': audio.frame_rate,
-                'channels': audio.channels,
-                'sample_width': audio.sample_width,
-                'frame_count': len(audio.get_array_of_samples())
-            }
-
-            # Export to bytes
-            output = io.BytesIO()
-            audio.export(output, format=self.config.format)
-            return output.getvalue(), metadata
+        # Decode straight from memory; no temp file round-trip
+        audio = AudioSegment.from_file(io.BytesIO(audio_data))
+        
+        # Validate duration
+        duration = len(audio) / 1000.0
+        if not (self.config.min_duration <= duration <= self.config.max_duration):
+            raise ValueError(f"Audio duration {duration}s out of range")
+
+        # Convert to required format
+        audio = self._convert_audio(audio)
+
+        # Get audio metadata
+        metadata = {
+            'duration': duration,
+            'sample_rate': audio.frame_rate,
+            'channels': audio.channels,
+            'sample_width': audio.sample_width,
+            'frame_count': len(audio.raw_data) // audio.sample_width
+        }
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        # PCM WAV only needs a header in front of the raw samples
+        if self.config.format == "wav":
+            return _wav_header(audio) + audio.raw_data, metadata
+
+        # Export and hand back a view of the buffer rather than a copy
+        output = io.BytesIO()
+        audio.export(output, format=self.config.format)
+        return output.getbuffer(), metadata
+
+    def _passthrough_wav(self, audio_data: bytes) -> Optional[tuple[bytes, Dict]]:
+        """Return canonical PCM WAV input untouched if it already matches the target format"""
+        if self.config.format != "wav" or len(audio_data) < 44:
+            return None
+
+        (riff, _, wave, fmt, fmt_size, audio_format, channels, sample_rate,
+         _, _, bits_per_sample, data, data_size) = struct.unpack(
+            '<4sI4s4sIHHIIHH4sI', audio_data[:44]
+        )
+        if (
+            (riff, wave, fmt, data) != (b'RIFF', b'WAVE', b'fmt ', b'data')
+            or (fmt_size, audio_format) != (16, 1)
+            or (channels, sample_rate, bits_per_sample)
+            != (self.config.channels, self.config.sample_rate, 16)
+            or 44 + data_size != len(audio_data)
+        ):
+            return None
+
+        frame_count = data_size // 2
+        duration = frame_count / sample_rate
+        if not (self.config.min_duration <= duration <= self.config.max_duration):
+            raise ValueError(f"Audio duration {duration}s out of range")
+
+        return audio_data, {
+            'duration': duration,
+            'sample_rate': sample_rate,
+            'channels': channels,
+            'sample_width': 2,
+            'frame_count': frame_count
+        }
 
     def _convert_audio(self, audio: AudioSegment) -> AudioSegment:
         """Convert audio to required format"""
-        if audio.frame_rate != self.config.sample_rate:
-            audio = audio.set_frame_rate(self.config.sample_rate)
-        if audio.channels != self.config.channels:
-            audio = audio.set_channels(self.config.channels)
-        return audio
+        needs_resample = audio.frame_rate != self.config.sample_rate
+        needs_downmix = audio.channels != self.config.channels
+        if not (needs_resample or needs_downmix):
+            return audio
+
+        # NumPy path covers 16-bit input mixed down to mono
+        if (
+            audio.sample_width != 2
+            or (needs_downmix and self.config.channels != 1)
+            or (needs_resample and soxr is None)
+        ):
+            if needs_resample:
+                audio = audio.set_frame_rate(self.config.sample_rate)
+            if needs_downmix:
+                audio = audio.set_channels(self.config.channels)
+            return audio
+
+        samples = np.frombuffer(audio.raw_data, dtype=np.int16).reshape(-1, audio.channels)
+
+        # Downmix first so the resampler only sees one channel
+        if needs_downmix:
+            samples = samples.mean(axis=1, keepdims=True)
+
+        if needs_resample:
+            samples = soxr.resample(
+                samples,
+                audio.frame_rate,
+                self.config.sample_rate,
+                quality='HQ'
+            )
+
+        if samples.dtype != np.int16:
+            samples = np.clip(np.rint(samples), -32768, 32767).astype(np.int16)
+
+        return audio._spawn(
+            samples.tobytes(),
+            overrides={
+                'frame_rate': self.config.sample_rate,
+                'channels': self.config.channels,
+                'frame_width': self.config.channels * 2
+            }
+        )
 
 class SpeechProcessor:
     """Main speech processor following our flow:
     Input Path: Audio/Text → Native STT/Text → English Translation → Return ProcessedSpeech
     Output Path: English Text → Native Translation → TTS → Return ProcessedResponse
     """
+    BACKOFF_BASE = 0.25  # seconds
+    MAX_BACKOFF = 8.0  # seconds
+
     def __init__(self):
         self.audio_config = AudioConfig()
         self.audio_processor = AudioProcessor(self.audio_config)
         self.bhashini_service = BhashiniService()
         
-        # Async resources
-        self.processing_semaphore = asyncio.Semaphore(5)
+        # Async resources: outer gate for the whole pipeline, inner gate
+        # for remote Bhashini STT/TTS calls (defaults to the pipeline limit,
+        # lower it only to respect a Bhashini rate quota)
+        max_pipelines = 16
+        self.processing_semaphore = asyncio.Semaphore(max_pipelines)
+        self.inference_semaphore = asyncio.Semaphore(
+            int(os.getenv("STT_TTS_CONCURRENCY", str(max_pipelines)))
+        )
         self.stream_buffers: Dict[str, io.BytesIO] = {}
         
         # Cache for session metadata
         self.session_metadata: Dict[str, Dict] = {}
+
+        # LRU caches for repeated translations and synthesized speech
+        self._tx_cache: OrderedDict = OrderedDict()
+        self._tts_cache: OrderedDict = OrderedDict()
+        self._cache_max_size = 256
+        # Audio payloads are large, so the TTS cache is also capped by size
+        self._tts_cache_max_bytes = int(os.getenv("TTS_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+        self._tts_cache_bytes = 0
         self.initialized = False
 
     async def initialize(self):
@@ -152,17 +252,19 @@ class SpeechProcessor:
 
         async with self.processing_semaphore:
             try:
-                start_time = datetime.utcnow()
+                start = time.perf_counter()
                 session_id = session_id or str(uuid.uuid4())
                 
-                logger.info(f"""
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("""
     === Input Processing Started ===
-    Session ID: {session_id}
-    Source Language: {source_language}
-    Input Type: {'Audio' if is_audio else 'Text'}
-    Stream Mode: {stream}
-    Start Time: {start_time.isoformat()}
-                """)
+    Session ID: %s
+    Source Language: %s
+    Input Type: %s
+    Stream Mode: %s
+    Start Time: %s
+                    """, session_id, source_language, 'Audio' if is_audio else 'Text',
+                        stream, datetime.utcnow().isoformat())
 
                 detected_language = source_language
                 audio_metadata = {}
@@ -171,74 +273,82 @@ class SpeechProcessor:
                 if is_audio:
                     logger.info("=== Starting Audio Processing Phase ===")
                     processed_audio, audio_metadata = await self.audio_processor.validate_and_convert(content)
-                    logger.info(f"""
+                    logger.info("""
     Audio Processing Results:
-    - Duration: {audio_metadata['duration']}s
-    - Sample Rate: {audio_metadata.get('sample_rate')}
-    - Channels: {audio_metadata.get('channels')}
-                    """)
-
-                    stt_result = await self.bhashini_service.speech_to_text(
-                        processed_audio,
-                        source_language=source_language
-                    )
+    - Duration: %ss
+    - Sample Rate: %s
+    - Channels: %s
+                    """, audio_metadata['duration'], audio_metadata.get('sample_rate'),
+                        audio_metadata.get('channels'))
+
+                    async with self.inference_semaphore:
+                        stt_result = await self.bhashini_service.speech_to_text(
+                            processed_audio,
+                            source_language=source_language
+                        )
                     original_text = self._extract_text_from_stt(stt_result)
                     
                     if not original_text:
                         raise ValueError("STT extraction failed")
                     
-                    logger.info(f"""
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("""
     Speech-to-Text Results:
-    - Text Length: {len(original_text)}
-    - Preview: '{original_text[:100]}...'
-                    """)
+    - Text Length: %s
+    - Preview: '%s...'
+                        """, len(original_text), original_text[:100])
                 else:
                     original_text = content
-                    logger.info(f"Text Input Length: {len(original_text)}")
+                    logger.info("Text Input Length: %s", len(original_text))
 
                 # Translation Phase
                 english_text = original_text
                 english_source = "original"
                 translation_metrics = {}
 
-                if source_language != "en":
-                    logger.info("=== Starting Translation Phase ===")
-                    translation_result = await self.translate_text(
-                        text=original_text,
-                        source_language=source_language,
-                        target_language="en"
-                    )
-                    
-                    if "error" not in translation_result:
-                        english_text = translation_result["translated_text"]
-                        english_source = "translation"
-                        translation_metrics = translation_result.get("metadata", {})
-                        
-                        logger.info(f"""
+                translation_result = await self.translate_text(
+                    text=original_text,
+                    source_language=source_language,
+                    target_language="en"
+                )
+                translated = not translation_result["metadata"].get("skipped", False)
+
+                if "error" in translation_result:
+                    logger.warning("Translation failed: %s", translation_result['error'])
+                elif translated:
+                    english_text = translation_result["translated_text"]
+                    english_source = "translation"
+                    translation_metrics = translation_result.get("metadata", {})
+
+                    logger.info("""
     Translation Results:
     - Success: True
-    - Original Length: {len(original_text)}
-    - Translated Length: {len(english_text)}
-    - Confidence: {translation_result.get('confidence', 'N/A')}
-                        """)
-                    else:
-                        logger.warning(f"Translation failed: {translation_result['error']}")
+    - Original Length: %s
+    - Translated Length: %s
+    - Confidence: %s
+                    """, len(original_text), len(english_text),
+                        translation_result.get('confidence', 'N/A'))
 
                 # Response Creation Phase
                 processing_path = [
                     "audio_processing" if is_audio else "text_input",
                     "stt" if is_audio else None,
-                    "translation" if source_language != "en" else None
+                    "translation" if translated else None
                 ]
+
+                # Wall-clock timestamps are only materialized for the response
+                duration = time.perf_counter() - start
+                completion_time = datetime.utcnow()
+                start_time = completion_time - timedelta(seconds=duration)
                 
                 response = ProcessedSpeech(
                     original_text=original_text,
                     english_text=english_text,
                     language_code=source_language,
-                    language_name=LanguageMetadata.get_language_name(source_language),
+                    language_name=_LANGUAGE_NAMES.get(source_language, "Unknown"),
                     confidence=translation_metrics.get('confidence', 1.0),
                     duration=audio_metadata.get('duration', 0.0),
-                    timestamp=datetime.utcnow(),
+                    timestamp=completion_time,
                     metadata={
                         "session_id": session_id,
                         "input_type": "audio" if is_audio else "text",
@@ -250,28 +360,31 @@ class SpeechProcessor:
                         "translation_metrics": translation_metrics,
                         "timestamps": {
                             "start": start_time.isoformat(),
-                            "completion": datetime.utcnow().isoformat()
+                            "completion": completion_time.isoformat()
                         }
                     }
                 )
 
-                logger.info(f"""
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("""
     === Input Processing Completed ===
-    Session: {session_id}
-    Duration: {(datetime.utcnow() - start_time).total_seconds()}s
-    Processing Path: {' -> '.join(filter(None, processing_path))}
-                """)
+    Session: %s
+    Duration: %ss
+    Processing Path: %s
+                    """, session_id, duration,
+                        ' -> '.join(filter(None, processing_path)))
 
                 return response
 
             except Exception as e:
-                logger.error(f"""
+                logger.error("""
     === Critical Input Processing Error ===
-    Session ID: {session_id}
-    Error: {str(e)}
-    Source Language: {source_language}
-    Processing Stage: {locals().get('current_stage', 'unknown')}
-                """, exc_info=True)
+    Session ID: %s
+    Error: %s
+    Source Language: %s
+    Processing Stage: %s
+                """, session_id, e, source_language,
+                    locals().get('current_stage', 'unknown'), exc_info=True)
                 raise HTTPException(
                     status_code=500,
                     detail={
@@ -291,15 +404,17 @@ class SpeechProcessor:
     ) -> Dict:
         """Process output with enhanced flow tracking"""
         try:
-            start_time = datetime.utcnow()
-            logger.info(f"""
+            start = time.perf_counter()
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("""
     === Output Processing Started ===
-    Target Language: {target_language}
-    Generate Speech: {generate_speech}
-    Input Text Length: {len(input_text)}
-    English Text Present: {english_text is not None}
-    Start Time: {start_time.isoformat()}
-            """)
+    Target Language: %s
+    Generate Speech: %s
+    Input Text Length: %s
+    English Text Present: %s
+    Start Time: %s
+                """, target_language, generate_speech, len(input_text),
+                    english_text is not None, datetime.utcnow().isoformat())
 
             # Translation Phase
             text_to_translate = english_text or input_text
@@ -308,34 +423,36 @@ class SpeechProcessor:
             confidence = 1.0
             translation_metrics = {}
 
-            if target_language != "en":
-                logger.info("=== Starting Translation Phase ===")
-                translation_result = await self.bhashini_service.translate_text(
-                    text=text_to_translate,
-                    source_language="en",
-                    target_language=target_language,
-                    preserve_medical_terms=True
+            # English output needs no translation, so synthesis starts now
+            # and overlaps with the rest of the bookkeeping
+            tts_task = None
+            if generate_speech and target_language == "en":
+                tts_task = asyncio.create_task(
+                    self._synthesize_speech(text_to_translate, target_language)
                 )
 
-                if "pipelineResponse" in translation_result:
-                    pipeline_response = translation_result["pipelineResponse"][0]
-                    if pipeline_response.get("output"):
-                        translated_text = pipeline_response["output"][0]["target"]
-                        confidence = pipeline_response.get("confidence", 1.0)
-                        translation_success = True
-                        translation_metrics = {
-                            "preserved_terms": translation_result.get("preservedTerms", []),
-                            "pipeline_id": translation_result.get("pipelineId"),
-                            "service_id": translation_result.get("serviceId")
-                        }
-                        
-                        logger.info(f"""
+            translation_result = await self.translate_text(
+                text_to_translate, "en", target_language
+            )
+            translation_attempted = not translation_result["metadata"].get("skipped", False)
+
+            if translation_attempted and "error" not in translation_result:
+                translated_text = translation_result["translated_text"]
+                confidence = translation_result["confidence"]
+                translation_success = True
+                translation_metrics = {
+                    "preserved_terms": translation_result["metadata"].get("preserved_terms", []),
+                    "service_id": translation_result["metadata"].get("service_id")
+                }
+
+                logger.info("""
     Translation Results:
     - Success: True
-    - Text Length: {len(translated_text)}
-    - Confidence: {confidence}
-    - Preserved Terms: {len(translation_metrics['preserved_terms'])}
-                        """)
+    - Text Length: %s
+    - Confidence: %s
+    - Preserved Terms: %s
+                """, len(translated_text), confidence,
+                    len(translation_metrics['preserved_terms']))
 
             # Speech Generation Phase
             audio_data = None
@@ -343,12 +460,14 @@ class SpeechProcessor:
             tts_metrics = {}
 
             if generate_speech:
-                logger.info(f"=== Starting Speech Generation Phase ===")
-                tts_result = await self.bhashini_service.text_to_speech(
-                    text=translated_text,
-                    target_language=target_language,
-                    gender="female"
-                )
+                logger.info("=== Starting Speech Generation Phase ===")
+                if tts_task is not None:
+                    tts_result = await tts_task
+                else:
+                    tts_result = await self._synthesize_speech(
+                        translated_text,
+                        target_language
+                    )
 
                 if tts_result and "audio_data" in tts_result:
                     audio_data = tts_result["audio_data"]
@@ -359,16 +478,17 @@ class SpeechProcessor:
                         "gender": "female"
                     }
                     
-                    logger.info(f"""
+                    logger.info("""
     Speech Generation Results:
     - Success: True
-    - Audio Size: {tts_metrics['audio_size']} bytes
-    - Format: {tts_metrics['format']}
-                    """)
+    - Audio Size: %s bytes
+    - Format: %s
+                    """, tts_metrics['audio_size'], tts_metrics['format'])
 
             # Create Enhanced Response
+            processing_duration = time.perf_counter() - start
             completion_time = datetime.utcnow()
-            processing_duration = (completion_time - start_time).total_seconds()
+            start_time = completion_time - timedelta(seconds=processing_duration)
 
             response = {
                 "translated_text": translated_text,
@@ -388,9 +508,9 @@ class SpeechProcessor:
                         "metrics": tts_metrics
                     },
                     "processing_path": {
-                        "translation": target_language != "en",
+                        "translation": translation_attempted,
                         "tts": generate_speech,
-                        "flow": "translation_tts" if target_language != "en" else "direct_tts"
+                        "flow": "translation_tts" if translation_attempted else "direct_tts"
                     },
                     "performance": {
                         "start_time": start_time.isoformat(),
@@ -399,29 +519,31 @@ class SpeechProcessor:
                     },
                     "language_info": {
                         "code": target_language,
-                        "name": LanguageMetadata.get_language_name(target_language),
-                        "script": LanguageMetadata.get_language_metadata(target_language).get("script")
+                        "name": _LANGUAGE_NAMES.get(target_language, "Unknown"),
+                        "script": _LANGUAGE_SCRIPTS.get(target_language)
                     }
                 }
             }
 
-            logger.info(f"""
+            logger.info("""
     === Output Processing Completed ===
-    Duration: {processing_duration}s
-    Flow: {response['metadata']['processing_path']['flow']}
-    Translation: {'Success' if translation_success else 'Not Required'}
-    Speech: {'Generated' if tts_success else 'Not Generated'}
-            """)
+    Duration: %ss
+    Flow: %s
+    Translation: %s
+    Speech: %s
+            """, processing_duration, response['metadata']['processing_path']['flow'],
+                'Success' if translation_success else 'Not Required',
+                'Generated' if tts_success else 'Not Generated')
 
             return response
 
         except Exception as e:
-            logger.error(f"""
+            logger.error("""
     === Critical Output Processing Error ===
-    Target Language: {target_language}
-    Error: {str(e)}
-    Processing Stage: {locals().get('current_stage', 'unknown')}
-            """, exc_info=True)
+    Target Language: %s
+    Error: %s
+    Processing Stage: %s
+            """, target_language, e, locals().get('current_stage', 'unknown'), exc_info=True)
             raise RuntimeError(f"Output processing failed: {str(e)}")
 
 
@@ -437,6 +559,20 @@ class SpeechProcessor:
         retry_count = 0
         last_error = None
 
+        # Same-language requests need no Bhashini round trip
+        if source_language == target_language:
+            return {
+                "translated_text": text,
+                "confidence": 1.0,
+                "metadata": {
+                    "source_text": text,
+                    "source_language": source_language,
+                    "target_language": target_language,
+                    "skipped": True,
+                    "timestamp": datetime.utcnow().isoformat()
+                }
+            }
+
         # Input validation
         if not text or not text.strip():
             logger.error("Empty text provided for translation")
@@ -450,9 +586,8 @@ class SpeechProcessor:
             }
 
         # Language validation
-        if not LanguageMetadata.is_language_supported(source_language) or \
-        not LanguageMetadata.is_language_supported(target_language):
-            logger.error(f"Unsupported language pair: {source_language} -> {target_language}")
+        if source_language not in _LANGUAGE_NAMES or target_language not in _LANGUAGE_NAMES:
+            logger.error("Unsupported language pair: %s -> %s", source_language, target_language)
             return {
                 "translated_text": text,
                 "confidence": 0.0,
@@ -464,10 +599,25 @@ class SpeechProcessor:
                 }
             }
 
+        # Serve repeated phrases without calling Bhashini
+        cache_key = hashlib.md5(
+            f"{text}|{source_language}|{target_language}".encode()
+        ).digest()
+        cached = self._cache_get(self._tx_cache, cache_key)
+        if cached is not None:
+            # Fresh per-call copy so callers never share or see stale metadata
+            result = copy.deepcopy(cached)
+            result["metadata"].update({
+                "retry_count": 0,
+                "timestamp": datetime.utcnow().isoformat(),
+                "cached": True
+            })
+            return result
+
         while retry_count < max_retries:
             try:
-                logger.info(f"Translation attempt {retry_count + 1} - {source_language} to {target_language}")
-                logger.debug(f"Input text: {text[:100]}...")
+                logger.info("Translation attempt %s - %s to %s", retry_count + 1, source_language, target_language)
+                logger.debug("Input text: %s...", text[:100])
 
                 # Call Bhashini service with payload validation
                 translation = await self.bhashini_service.translate_text(
@@ -480,44 +630,49 @@ class SpeechProcessor:
                 # Extract and validate translation
                 translated_text = self._extract_translation(translation)
                 if translated_text:
-                    logger.info(f"Translation successful - Length: {len(translated_text)} chars")
-                    return {
+                    logger.info("Translation successful - Length: %s chars", len(translated_text))
+                    task_response = translation["pipelineResponse"][0]
+                    result = {
                         "translated_text": translated_text,
-                        "confidence": translation.get("confidence", 1.0),
+                        "confidence": task_response.get("confidence", 1.0),
                         "metadata": {
                             "source_text": text,
                             "source_language": source_language,
                             "target_language": target_language,
                             "retry_count": retry_count,
                             "timestamp": datetime.utcnow().isoformat(),
-                            "preserved_terms": translation.get("preservedTerms", []),
-                            "service_id": translation.get("serviceId", "default")
+                            "preserved_terms": task_response.get("preservedTerms", []),
+                            "service_id": task_response.get("metadata", {}).get("service_id", "default")
                         }
                     }
+                    self._cache_put(self._tx_cache, cache_key, copy.deepcopy(result))
+                    return result
 
                 # Handle empty translation
                 retry_count += 1
                 last_error = "Empty translation result"
-                logger.warning(f"Empty translation on attempt {retry_count}")
+                logger.warning("Empty translation on attempt %s", retry_count)
                 
                 if retry_count < max_retries:
-                    await asyncio.sleep(0.5 * retry_count)
+                    await asyncio.sleep(self._retry_delay(retry_count))
                     continue
 
             except Exception as e:
                 retry_count += 1
                 last_error = str(e)
                 logger.warning(
-                    f"Translation attempt {retry_count} failed: {last_error}",
+                    "Translation attempt %s failed: %s",
+                    retry_count,
+                    last_error,
                     exc_info=True
                 )
 
                 if retry_count < max_retries:
-                    await asyncio.sleep(0.5 * retry_count)
+                    await asyncio.sleep(self._retry_delay(retry_count))
                     continue
 
         # Return fallback response after all retries
-        logger.error(f"Translation failed after {max_retries} attempts")
+        logger.error("Translation failed after %s attempts", max_retries)
         return {
             "translated_text": text,
             "confidence": 0.0,
@@ -534,103 +689,117 @@ class SpeechProcessor:
         }
 
 
+    def _retry_delay(self, retry_count: int) -> float:
+        """Capped exponential backoff with jitter"""
+        delay = min(self.MAX_BACKOFF, self.BACKOFF_BASE * (2 ** retry_count))
+        return delay + random.uniform(0, 0.1)
+
+    async def _synthesize_speech(self, text: str, target_language: str) -> Optional[Dict]:
+        """Generate speech for text, reusing cached audio when available"""
+        tts_key = (text, target_language, "female")
+        cached = self._cache_get(self._tts_cache, tts_key)
+        if cached is not None:
+            return dict(cached)
+
+        async with self.inference_semaphore:
+            tts_result = await self.bhashini_service.text_to_speech(
+                text=text,
+                target_language=target_language,
+                gender="female"
+            )
+        if tts_result and "audio_data" in tts_result:
+            self._tts_cache_put(tts_key, dict(tts_result))
+        return tts_result
+
+    def _cache_get(self, cache: OrderedDict, key: Any) -> Optional[Any]:
+        """Get an entry from an LRU cache, marking it recently used"""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, cache: OrderedDict, key: Any, value: Any) -> None:
+        """Add an entry to an LRU cache, evicting the oldest if full"""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self._cache_max_size:
+            cache.popitem(last=False)
+
+    def _tts_cache_put(self, key: Any, value: Dict) -> None:
+        """Add synthesized audio to the TTS cache, bounded by entries and total bytes"""
+        size = len(value["audio_data"])
+        if size > self._tts_cache_max_bytes:
+            return
+
+        previous = self._tts_cache.pop(key, None)
+        if previous is not None:
+            self._tts_cache_bytes -= len(previous["audio_data"])
+
+        self._tts_cache[key] = value
+        self._tts_cache_bytes += size
+        while (len(self._tts_cache) > self._cache_max_size
+               or self._tts_cache_bytes > self._tts_cache_max_bytes):
+            _, evicted = self._tts_cache.popitem(last=False)
+            self._tts_cache_bytes -= len(evicted["audio_data"])
+
     def _extract_text_from_stt(self, stt_result: Dict) -> str:
         """Extract text from STT response with validation"""
         try:
-            if isinstance(stt_result, dict):
-                if "text" in stt_result:
-                    return stt_result["text"]
-                elif "pipelineResponse" in stt_result:
-                    pipeline_response = stt_result["pipelineResponse"]
-                    if pipeline_response and isinstance(pipeline_response, list):
-                        response_data = pipeline_response[0]
-                        if "output" in response_data and response_data["output"]:
-                            text = response_data["output"][0].get("source", "")
-                            if text:
-                                return text
-            logger.warning("Failed to extract text from STT response")
-            return ""
-        except Exception as e:
-            logger.error(f"STT text extraction error: {str(e)}")
-            return ""
+            if "text" in stt_result:
+                return stt_result["text"]
+            text = stt_result["pipelineResponse"][0]["output"][0].get("source", "")
+            if text:
+                return text
+        except (KeyError, IndexError, TypeError, AttributeError):
+            pass
+        logger.warning("Failed to extract text from STT response")
+        return ""
 
     def _extract_translation(self, translation: Dict) -> str:
         """Extract translated text from translation response with validation"""
-        try:
-            logger.debug(f"Processing translation response: {json.dumps(translation, indent=2)}")
-            
-            # Validate response structure
-            if not isinstance(translation, dict):
-                logger.error("Invalid translation response type")
-                return ""
-
-            if "pipelineResponse" not in translation:
-                logger.error("Missing pipelineResponse in translation")
-                return ""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing translation response: %s", orjson.dumps(translation, default=str, option=orjson.OPT_INDENT_2).decode())
 
-            pipeline_resp = translation["pipelineResponse"]
-            
-            # Validate pipeline response
-            if not pipeline_resp or not isinstance(pipeline_resp, list):
-                logger.error("Invalid pipeline response format")
-                return ""
-
-            first_response = pipeline_resp[0]
-            logger.debug(f"Pipeline first response: {json.dumps(first_response, indent=2)}")
-
-            # Extract and validate output
-            if not first_response or "output" not in first_response:
-                logger.error("Missing output in pipeline response")
-                return ""
-
-            outputs = first_response["output"]
-            if not outputs or not isinstance(outputs, list):
-                logger.error("Invalid outputs format")
-                return ""
-
-            first_output = outputs[0]
-            if not first_output or "target" not in first_output:
-                logger.error("Missing target in output")
-                return ""
-
-            # Process translated text
+        try:
+            first_response = translation["pipelineResponse"][0]
+            first_output = first_response["output"][0]
             translated_text = first_output["target"].strip()
-            if not translated_text:
-                logger.warning("Empty translated text received")
-                return ""
-
-            # Log success with metadata
-            logger.info(f"Translation extracted successfully:")
-            logger.info(f"- Source: {first_output.get('source', 'N/A')}")
-            logger.info(f"- Target: {translated_text[:50]}...")
-            logger.info(f"- Length: {len(translated_text)} characters")
-            logger.info(f"- Task Type: {first_response.get('taskType', 'N/A')}")
-
-            return translated_text
-
-        except Exception as e:
+        except (KeyError, IndexError, TypeError, AttributeError) as e:
             logger.error(
                 "Translation extraction failed",
                 extra={
                     "error": str(e),
                     "response_type": type(translation).__name__,
                     "has_pipeline": "pipelineResponse" in translation if isinstance(translation, dict) else False
-                },
-                exc_info=True
+                }
             )
             return ""
 
+        if not translated_text:
+            logger.warning("Empty translated text received")
+            return ""
+
+        # Log success with metadata
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Translation extracted successfully:")
+            logger.info("- Source: %s", first_output.get('source', 'N/A'))
+            logger.info("- Target: %s...", translated_text[:50])
+            logger.info("- Length: %s characters", len(translated_text))
+            logger.info("- Task Type: %s", first_response.get('taskType', 'N/A'))
+
+        return translated_text
+
 
     async def cleanup(self):
         """Cleanup resources with error handling"""
         try:
             # Cleanup stream buffers
+            buffer_count = len(self.stream_buffers)
             for buffer in self.stream_buffers.values():
-                try:
+                with contextlib.suppress(Exception):
                     buffer.close()
-                except Exception as e:
-                    logger.error(f"Buffer cleanup error: {str(e)}")
             self.stream_buffers.clear()
+            logger.debug("Closed %s stream buffers", buffer_count)
             
             # Cleanup session metadata
             self.session_metadata.clear()
@@ -638,9 +807,6 @@ class SpeechProcessor:
             # Cleanup services
             await self.bhashini_service.cleanup()
             
-            # Cleanup thread pool
-            self.audio_processor.thread_pool.shutdown()
-            
             logger.info("Speech processor cleanup completed successfully")
             
         except Exception as e:
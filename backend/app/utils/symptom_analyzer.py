@@ -1,21 +1,206 @@
 # backend/app/utils/symptom_analyzer.py
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Union
+from collections import OrderedDict
+import hashlib
 import logging
+import os
+import time
 from app.utils.ai_config import GeminiConfig
-import json
-from transformers import pipeline
+import orjson
+from pydantic import BaseModel, Field, ValidationError, field_validator
+import torch
+from transformers import AutoModelForTokenClassification, AutoTokenizer
 from app.config.language_metadata import LanguageMetadata
 import asyncio
-from functools import lru_cache
 import numpy as np
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import partial
 from datetime import datetime, timezone
 from typing import Set
 import re
+import threading
+
+try:
+    import onnxruntime
+    from optimum.onnxruntime import ORTModelForTokenClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+except ImportError:
+    ORTModelForTokenClassification = None
 
 
 logger = logging.getLogger(__name__)
 
+NER_MODEL_NAME = "samrawal/bert-base-uncased_clinical-ner"
+NER_ONNX_DIR = os.getenv("NER_ONNX_DIR", "./ner_onnx")
+NER_WINDOW_OVERLAP = 32  # tokens shared by consecutive NER windows
+NER_INFERENCE_BATCH = 32  # chunks per forward pass
+
+# Entity groups (B-/I- tags merged by _group_entities) that denote symptoms
+_PROBLEM_GROUPS = frozenset({"PROBLEM", "problem"})
+
+_WORD_RE = re.compile(r'\b\w+\b')
+_JSON_RE = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', re.DOTALL)
+_FENCE_RE = re.compile(r'```(?:json)?\s*(.*?)\s*```', re.DOTALL)
+
+# Common words never worth sending for medical relevance checks
+_STOPWORDS = frozenset({
+    "about", "after", "again", "also", "been", "before", "being", "could",
+    "does", "doing", "during", "each", "from", "have", "having", "into",
+    "more", "most", "other", "over", "should", "some", "such", "than",
+    "that", "their", "them", "then", "there", "these", "they", "this",
+    "those", "through", "under", "until", "very", "were", "what", "when",
+    "where", "which", "while", "will", "with", "would", "your", "please",
+    "patient", "doctor", "recommend", "recommended", "consult", "advice"
+})
+
+# Pleasantries and filler; a text made only of these (greetings, thanks,
+# acknowledgements) cannot contain a symptom and skips NER
+_SMALL_TALK = frozenset({
+    "a", "all", "alright", "am", "and", "bye", "care", "cool", "doctor",
+    "evening", "fine", "for", "good", "goodbye", "got", "great", "hello",
+    "hey", "hi", "i", "im", "is", "it", "lot", "m", "me", "morning", "much",
+    "my", "night", "no", "noted", "ok", "okay", "please", "right", "s", "see",
+    "so", "sure", "take", "thank", "thanks", "that", "the", "this", "to",
+    "too", "very", "we", "welcome", "yeah", "yes", "you"
+})
+
+def _needs_ner(text: str) -> bool:
+    """Whether text has any word beyond small talk"""
+    return any(word not in _SMALL_TALK for word in _WORD_RE.findall(text.lower()))
+
+# Gemini prompt templates, filled with str.format
+_CONTENT_PROMPT = """
+Analyze the following medical text and identify:
+1. Medical terms and symptoms
+2. Severity indicators
+3. Emergency signals
+4. Treatment references
+
+Text: {text}
+
+Provide structured analysis with confidence scores.
+"""
+
+_CONVERSATION_PROMPT = """
+Analyze this medical conversation (language: {language}).
+Return a JSON object with these exact fields:
+{{
+    "medical_terms": [],
+    "severity_score": (1-10),
+    "urgency_level": "low/medium/high",
+    "key_risk_factors": [],
+    "time_sensitivity": "routine/urgent/emergency"
+}}
+"medical_terms" must list only valid clinical terms, symptoms and conditions.
+
+Text: {text}
+"""
+
+_TERMS_PROMPT = """
+For each term, determine if it is a valid medical term, symptom, or condition.
+Terms: {terms}
+Return only the valid medical terms as a JSON array.
+"""
+
+_VALIDATION_PROMPT = """
+Analyze and validate this medical consultation:
+
+ANALYSIS TEXT:
+{analysis_text}
+
+CONVERSATION HISTORY:
+{conversation}
+
+VALIDATED MEDICAL TERMS:
+{terms}
+
+Provide a detailed validation focusing on:
+1. Safety concerns and potential risks
+2. Missing critical medical information
+3. Required follow-up actions
+4. Treatment compliance considerations
+
+Return a JSON object with the following structure:
+{{
+    "safety_concerns": [],
+    "suggested_improvements": [],
+    "critical_missing_info": [],
+    "follow_up_recommendations": []
+}}
+"""
+
+_SEVERITY_PROMPT = """
+Analyze these symptoms for severity. Return a JSON object with these exact fields:
+{{
+    "severity_score": (1-10),
+    "urgency_level": "low/medium/high",
+    "key_risk_factors": [],
+    "time_sensitivity": "routine/urgent/emergency"
+}}
+
+Text: {text}
+"""
+
+_TREATMENT_PROMPT = """
+Provide treatment recommendations for these symptoms:
+{symptoms}
+
+Return a JSON with these exact fields:
+{{
+    "medications": [],
+    "homeRemedies": []
+}}
+"""
+
+_SPECIALIST_PROMPT = """
+Based on these symptoms, recommend the most appropriate medical specialist:
+{symptoms}
+
+Return only the specialist type as a single string (e.g. 'Cardiologist', 'General Physician', etc.)
+"""
+
+_iso_cache = [-1, ""]  # monotonic second, formatted UTC timestamp
+
+def _now_iso() -> str:
+    """Current UTC time in ISO format, reformatted at most once per second"""
+    bucket = int(time.monotonic())
+    if bucket != _iso_cache[0]:
+        _iso_cache[0] = bucket
+        _iso_cache[1] = datetime.now(timezone.utc).isoformat()
+    return _iso_cache[1]
+
+def _parse_json(text: str) -> Dict:
+    """Parse the first JSON object embedded in a model response"""
+    fenced = _FENCE_RE.search(text)
+    if fenced:
+        try:
+            parsed = orjson.loads(fenced.group(1))
+            if isinstance(parsed, dict):
+                return parsed
+        except orjson.JSONDecodeError:
+            pass
+
+    match = _JSON_RE.search(text)
+    if not match:
+        return {}
+    try:
+        return orjson.loads(match.group(0))
+    except orjson.JSONDecodeError:
+        return {}
+
+class SeverityResponse(BaseModel):
+    """Severity fields expected back from Gemini"""
+    severity_score: int = Field(1, ge=1, le=10)
+    urgency_level: Literal["low", "medium", "high"] = "low"
+    key_risk_factors: List[str] = []
+    time_sensitivity: Literal["routine", "urgent", "emergency"] = "routine"
+
+    @field_validator("urgency_level", "time_sensitivity", mode="before")
+    @classmethod
+    def normalize_label(cls, v):
+        return v.strip().lower() if isinstance(v, str) else v
+
 class SymptomAnalyzer:
     def __init__(self):
         self.ai_config = GeminiConfig()
@@ -24,53 +209,139 @@ class SymptomAnalyzer:
         self._initialize_ner_models()
         
         # Thread pool for CPU-intensive operations
-        self.thread_pool = ThreadPoolExecutor(max_workers=2)
+        self.ner_workers = min(32, os.cpu_count() or 1)
+        self.thread_pool = ThreadPoolExecutor(max_workers=self.ner_workers)
+
+        # NER requests from concurrent callers are micro-batched by a
+        # background task, started on first use
+        self.ner_batch_size = 32
+        self.ner_batch_timeout = 0.02  # seconds
+        self._ner_queue: Optional[asyncio.Queue] = None
+        self._ner_slots: Optional[asyncio.Semaphore] = None
+        self._ner_server_task: Optional[asyncio.Task] = None
+
+        # Entities per chunk digest, shared by the NER worker threads
+        self.max_chunk_cache_size = 4096
+        self._chunk_entity_cache: OrderedDict[bytes, List[Dict]] = OrderedDict()
+        self._chunk_cache_lock = threading.Lock()
+
+        # The fast tokenizer keeps padding/truncation state on the shared Rust
+        # object, so worker threads must not call it concurrently
+        self._tokenizer_lock = threading.Lock()
         
         # Caching configurations
         self.cache_ttl = 3600  # 1 hour
         self.max_cache_size = 1000
+        self.analysis_cache: OrderedDict[str, tuple] = OrderedDict()
+
+        # Medical relevance verdicts per lowercase term, persisted across restarts
+        self.max_term_cache_size = 10000
+        self.term_cache_path = os.getenv("MEDICAL_TERM_CACHE_PATH")
+        self._term_validity: OrderedDict[str, bool] = self._load_term_validity()
         
 
     def _initialize_ner_models(self):
         """Initialize NER models with optimization"""
         try:
-            # Primary medical NER model
-            self.medical_ner = pipeline(
-                "ner",
-                model="samrawal/bert-base-uncased_clinical-ner",
-                device=0 if self._cuda_available() else -1,
-                batch_size=32
-            )
-            
-            # Simplified model for quick checks
-            self.quick_ner = pipeline(
-                "ner",
-                model="samrawal/bert-base-uncased_clinical-ner",
-                device=0 if self._cuda_available() else -1,
-                batch_size=32,
-                aggregation_strategy="simple"
-            )
+            use_cuda = self._cuda_available()
+            model = tokenizer = None
+            if ORTModelForTokenClassification is not None:
+                try:
+                    model, tokenizer = self._load_onnx_ner()
+                except Exception as e:
+                    logger.warning(f"ONNX NER unavailable, using PyTorch: {str(e)}")
+
+            if model is None:
+                # PyTorch weights run in half precision on GPU; attention goes
+                # through torch's fused scaled_dot_product_attention kernels
+                model_options = {"attn_implementation": "sdpa"}
+                if use_cuda:
+                    model_options["torch_dtype"] = torch.float16
+                else:
+                    self._limit_torch_threads(torch)
+                model = AutoModelForTokenClassification.from_pretrained(NER_MODEL_NAME, **model_options)
+                if use_cuda:
+                    model.to("cuda")
+                tokenizer = AutoTokenizer.from_pretrained(NER_MODEL_NAME)
+
+            # The model is driven directly rather than through a transformers
+            # pipeline; entities are grouped from the logits in _predict_entities
+            self.ner_model = model
+            self.ner_tokenizer = tokenizer
+            self.ner_labels = model.config.id2label
+            self._ner_outside_id = model.config.label2id.get("O", -1)
             
-            logger.info("NER models initialized successfully")
+            logger.info("NER model initialized successfully")
         except Exception as e:
-            logger.error(f"Error initializing NER models: {str(e)}")
+            logger.error(f"Error initializing NER model: {str(e)}")
             raise
 
+    def _limit_torch_threads(self, torch):
+        """Keep CPU inference single-threaded; concurrency comes from the NER thread pool"""
+        # Concurrent requests each spinning up all cores contend far more than
+        # they gain; single-user batch jobs can raise NER_TORCH_THREADS
+        threads = int(os.getenv("NER_TORCH_THREADS", "1"))
+        torch.set_num_threads(threads)
+        # Only settable before any inter-op work has started in the process
+        with suppress(RuntimeError):
+            torch.set_num_interop_threads(threads)
+
+    def _load_onnx_ner(self):
+        """Load the NER model through ONNX Runtime, exporting it on first use"""
+        use_cuda = self._cuda_available()
+        provider = "CUDAExecutionProvider" if use_cuda else "CPUExecutionProvider"
+        if not os.path.isdir(NER_ONNX_DIR):
+            model = ORTModelForTokenClassification.from_pretrained(NER_MODEL_NAME, export=True)
+            model.save_pretrained(NER_ONNX_DIR)
+            AutoTokenizer.from_pretrained(NER_MODEL_NAME).save_pretrained(NER_ONNX_DIR)
+
+        # CPU inference uses a dynamically quantized int8 copy of the weights
+        file_name = None
+        if not use_cuda:
+            file_name = "model_quantized.onnx"
+            if not os.path.exists(os.path.join(NER_ONNX_DIR, file_name)):
+                quantizer = ORTQuantizer.from_pretrained(NER_ONNX_DIR)
+                quantizer.quantize(
+                    save_dir=NER_ONNX_DIR,
+                    quantization_config=AutoQuantizationConfig.avx2(
+                        is_static=False, per_channel=False
+                    )
+                )
+
+        # Full graph fusion; single-threaded like the torch path, since up to
+        # ner_workers batches run concurrently from the NER thread pool
+        session_options = onnxruntime.SessionOptions()
+        session_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        session_options.inter_op_num_threads = 1
+        session_options.intra_op_num_threads = int(os.getenv("NER_INTRA_OP_THREADS", "1"))
+
+        model = ORTModelForTokenClassification.from_pretrained(
+            NER_ONNX_DIR,
+            file_name=file_name,
+            provider=provider,
+            session_options=session_options
+        )
+        tokenizer = AutoTokenizer.from_pretrained(NER_ONNX_DIR)
+        logger.info(f"Loaded ONNX NER model with {provider}")
+        return model, tokenizer
+
+    def _iter_conversation_messages(self, chat_history: List[Dict]) -> Iterator[str]:
+        """Yield one text per message, preferring its English translation"""
+        for message in chat_history:
+            text = message.get("english_content") or message.get("content")
+            if text:
+                yield text
+
     def _extract_conversation_text(self, chat_history: List[Dict]) -> str:
         """Extract text from conversation history"""
-        conversation_text = []
-        for message in chat_history:
-            if "content" in message:
-                conversation_text.append(message["content"])
-            if "english_content" in message:
-                conversation_text.append(message["english_content"])
-        return " ".join(conversation_text)
+        return " ".join(self._iter_conversation_messages(chat_history))
 
-    @lru_cache(maxsize=100)
     async def analyze_medical_content(self, text: str, language: str) -> Dict:
         """Analyze medical content using AI"""
         try:
-            cache_key = f"{text}:{language}"
+            cache_key = hashlib.blake2b(
+                f"{text}|{language}".encode(), digest_size=16
+            ).hexdigest()
             
             # Check cache first
             cached_result = self._get_cached_analysis(cache_key)
@@ -78,28 +349,21 @@ class SymptomAnalyzer:
                 return cached_result
 
             # Prepare analysis prompt
-            prompt = f"""
-            Analyze the following medical text and identify:
-            1. Medical terms and symptoms
-            2. Severity indicators
-            3. Emergency signals
-            4. Treatment references
-            
-            Text: {text}
-            
-            Provide structured analysis with confidence scores.
-            """
+            prompt = _CONTENT_PROMPT.format(text=text)
+
+            # NER has no dependency on the AI output, so it runs meanwhile
+            ner_task = asyncio.create_task(self._process_ner(text))
 
             # Get AI analysis
-            response = await self.ai_config.model.generate_content(prompt)
-            analysis = json.loads(response.text)  # Assuming structured JSON response
+            try:
+                response = await self.ai_config.model.generate_content_async(prompt)
+                analysis = orjson.loads(response.text)  # Assuming structured JSON response
+            except Exception:
+                ner_task.cancel()
+                raise
             
-            # Quick validation using NER
-            ner_entities = self.ner_pipeline(text)
-            medical_entities = [
-                entity for entity in ner_entities 
-                if entity['entity'].startswith('B-PROBLEM')
-            ]
+            # Quick validation using NER (entities are already PROBLEM spans only)
+            medical_entities = await ner_task
             
             # Combine AI and NER results
             combined_analysis = {
@@ -109,7 +373,7 @@ class SymptomAnalyzer:
                 "emergency_indicators": analysis.get("emergency_signals", []),
                 "confidence": analysis.get("confidence", 0.0),
                 "ner_validated": bool(medical_entities),
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": _now_iso()
             }
             
             # Cache the result
@@ -130,12 +394,12 @@ class SymptomAnalyzer:
 
     def _get_cached_analysis(self, key: str) -> Optional[Dict]:
         """Get cached analysis if valid"""
-        if key in self.analysis_cache:
-            cached = self.analysis_cache[key]
-            cache_time = datetime.fromisoformat(cached["timestamp"])
-            
-            if datetime.now(timezone.utc) - cache_time < self.cache_ttl:
-                return cached
+        entry = self.analysis_cache.get(key)
+        if entry is not None:
+            analysis, expiry = entry
+            if time.monotonic() < expiry:
+                self.analysis_cache.move_to_end(key)
+                return analysis
             
             # Remove expired cache
             del self.analysis_cache[key]
@@ -143,17 +407,25 @@ class SymptomAnalyzer:
 
     def _cache_analysis(self, key: str, analysis: Dict):
         """Cache analysis result"""
-        self.analysis_cache[key] = analysis
-        
-        # Clean old cache entries
-        current_time = datetime.now(timezone.utc)
-        expired_keys = [
-            k for k, v in self.analysis_cache.items()
-            if current_time - datetime.fromisoformat(v["timestamp"]) >= self.cache_ttl
-        ]
-        
-        for k in expired_keys:
-            del self.analysis_cache[k]
+        # Expired entries are dropped when read; the size bound below keeps
+        # anything never read again from accumulating
+        self.analysis_cache[key] = (analysis, time.monotonic() + self.cache_ttl)
+        self.analysis_cache.move_to_end(key)
+
+        # Bound the cache, dropping least recently used entries
+        while len(self.analysis_cache) > self.max_cache_size:
+            self.analysis_cache.popitem(last=False)
+
+    async def _generate(self, prompt: str) -> str:
+        """Get Gemini's response text, reusing answers to identical prompts"""
+        cache_key = "prompt:" + hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        text = self._get_cached_analysis(cache_key)
+        if text is None:
+            response = await self.ai_config.model.generate_content_async(prompt)
+            text = response.text
+            if text:
+                self._cache_analysis(cache_key, text)
+        return text
 
     async def analyze_conversation(
         self,
@@ -163,33 +435,39 @@ class SymptomAnalyzer:
         """Analyze conversation with optimized processing"""
         try:
             # Extract relevant text
-            conversation_text = self._extract_conversation_text(chat_history)
-            
-            # Process in parallel
-            async with asyncio.TaskGroup() as group:
-                # NER analysis
-                ner_task = group.create_task(
-                    self._process_ner(conversation_text)
-                )
-                
-                # Medical term extraction
-                terms_task = group.create_task(
-                    self._extract_medical_terms(conversation_text, language)
-                )
-                
-                # Symptom severity analysis
-                severity_task = group.create_task(
-                    self._analyze_severity(conversation_text)
-                )
+            messages = list(self._iter_conversation_messages(chat_history))
+            conversation_text = " ".join(messages)
             
+            # NER runs alongside a single combined Gemini request
+            ner_entities, ai_analysis = await asyncio.gather(
+                self._process_ner(messages),
+                self._analyze_all_in_one(conversation_text, language)
+            )
+
+            ner_terms = [
+                entity["term"] for entity in ner_entities
+                if entity["confidence"] > 0.7
+            ]
+            ai_terms = ai_analysis.get("medical_terms", [])
+            if not isinstance(ai_terms, list):
+                ai_terms = []
+            medical_terms = list(set(ner_terms) | {term for term in ai_terms if isinstance(term, str)})
+
+            # A malformed severity verdict costs only the severity, not the NER results
+            severity_analysis = self._validate_severity(ai_analysis) if ai_analysis else None
+            severity = (
+                self._build_severity(severity_analysis, ner_entities)
+                if severity_analysis else self._get_default_severity()
+            )
+
             # Combine results
             analysis = {
-                "symptoms": ner_task.result(),
-                "medical_terms": terms_task.result(),
-                "severity": severity_task.result(),
+                "symptoms": ner_entities,
+                "medical_terms": medical_terms,
+                "severity": severity,
                 "emergency_level": self._determine_emergency_level(
-                    ner_task.result(),
-                    severity_task.result()
+                    ner_entities,
+                    severity
                 )
             }
             
@@ -199,16 +477,37 @@ class SymptomAnalyzer:
             logger.error(f"Error analyzing conversation: {str(e)}")
             return self._get_fallback_analysis()
 
-    async def _process_ner(self, text: str) -> List[Dict]:
+    async def _analyze_all_in_one(self, text: str, language: str) -> Dict:
+        """Extract medical terms and severity with one Gemini request"""
+        try:
+            prompt = _CONVERSATION_PROMPT.format(language=language, text=text)
+            return _parse_json(await self._generate(prompt))
+
+        except Exception as e:
+            logger.error(f"Combined analysis error: {str(e)}")
+            return {}
+
+    async def _process_ner(self, text: Union[str, List[str]]) -> List[Dict]:
         """Process NER with optimization"""
         try:
-            # Run NER in thread pool
-            loop = asyncio.get_event_loop()
-            entities = await loop.run_in_executor(
-                self.thread_pool,
-                self._run_ner,
-                text
-            )
+            # Pure small talk is not worth a model pass
+            if isinstance(text, str):
+                if not _needs_ner(text):
+                    return []
+            else:
+                text = [message for message in text if _needs_ner(message)]
+                if not text:
+                    return []
+
+            if self._ner_server_task is None or self._ner_server_task.done():
+                self._ner_queue = asyncio.Queue()
+                self._ner_slots = asyncio.Semaphore(self.ner_workers)
+                self._ner_server_task = asyncio.create_task(self._ner_server())
+
+            # Queue the text for the next micro-batch
+            future = asyncio.get_running_loop().create_future()
+            await self._ner_queue.put((text, future))
+            entities = await future
             
             # Process entities
             return self._process_entities(entities)
@@ -217,153 +516,292 @@ class SymptomAnalyzer:
             logger.error(f"NER processing error: {str(e)}")
             return []
 
-    def _run_ner(self, text: str) -> List[Dict]:
-        """Run NER model with batching"""
-        # Split text into manageable chunks
-        chunks = self._split_text(text, max_length=512)
-        
-        # Process chunks
-        all_entities = []
-        for chunk in chunks:
-            entities = self.medical_ner(chunk)
-            all_entities.extend(entities)
-        
-        return all_entities
+    async def _ner_server(self):
+        """Collect queued NER requests into batches and run them in the thread pool"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._ner_queue.get()]
+            deadline = loop.time() + self.ner_batch_timeout
+            while len(batch) < self.ner_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._ner_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
 
-    def _process_entities(self, entities: List[Dict]) -> List[Dict]:
-        """Process and deduplicate entities"""
-        processed = {}
-        for entity in entities:
-            if entity["entity"].startswith("B-PROBLEM"):
-                key = entity["word"].lower()
-                if key not in processed:
-                    processed[key] = {
-                        "term": entity["word"],
-                        "confidence": entity["score"],
-                        "count": 1
-                    }
-                else:
-                    processed[key]["count"] += 1
-                    processed[key]["confidence"] = max(
-                        processed[key]["confidence"],
-                        entity["score"]
-                    )
-        
-        return list(processed.values())
+            # Batches run concurrently, one per free worker; while all are
+            # busy, requests keep accumulating into the next batch
+            await self._ner_slots.acquire()
+            batch_future = loop.run_in_executor(
+                self.thread_pool,
+                self._run_ner,
+                [text for text, _ in batch]
+            )
+            batch_future.add_done_callback(
+                partial(self._resolve_ner_batch, [future for _, future in batch])
+            )
+
+    def _resolve_ner_batch(self, futures: List[asyncio.Future], batch_future: asyncio.Future):
+        """Hand a finished NER batch's results to each waiting caller"""
+        self._ner_slots.release()
+        if batch_future.cancelled():
+            for future in futures:
+                future.cancel()
+            return
+
+        error = batch_future.exception()
+        for index, future in enumerate(futures):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(batch_future.result()[index])
+
+    def _run_ner(self, texts: List[Union[str, List[str]]]) -> List[List[Dict]]:
+        """Run NER model with batching, returning entities per input text"""
+        # Split every text into manageable chunks, remembering its owner
+        chunks = []
+        lengths = []
+        overlaps = []
+        owners = []
+        for index, text in enumerate(texts):
+            for chunk, token_count, overlap in self._split_text(text, max_length=512):
+                chunks.append(chunk)
+                lengths.append(token_count)
+                overlaps.append(overlap)
+                owners.append(index)
 
-    @lru_cache(maxsize=1000)
-    def _split_text(self, text: str, max_length: int = 512) -> List[str]:
-        """Split text into optimal chunks"""
-        # Implement smart text splitting
-        return []  # Placeholder
+        entities_per_text = [[] for _ in texts]
+        if not chunks:
+            return entities_per_text
 
-    async def _extract_medical_terms(
+        # Chunks seen before (repeated turns, greetings) come from the cache;
+        # only the first occurrence of each unseen chunk is run
+        digests = [hashlib.blake2b(chunk.encode(), digest_size=16).digest() for chunk in chunks]
+        chunk_entities = [None] * len(chunks)
+        pending = {}
+        with self._chunk_cache_lock:
+            for index, digest in enumerate(digests):
+                cached = self._chunk_entity_cache.get(digest)
+                if cached is not None:
+                    self._chunk_entity_cache.move_to_end(digest)
+                    chunk_entities[index] = cached
+                elif digest not in pending:
+                    pending[digest] = index
+
+        if pending:
+            # One model pass over all misses, ordered by token count so each
+            # batch pads to similar sizes
+            order = sorted(pending.values(), key=lengths.__getitem__, reverse=True)
+            results = self._predict_entities([chunks[i] for i in order])
+
+            with self._chunk_cache_lock:
+                for index, entities in zip(order, results):
+                    self._chunk_entity_cache[digests[index]] = entities
+                    self._chunk_entity_cache.move_to_end(digests[index])
+                    chunk_entities[index] = entities
+                while len(self._chunk_entity_cache) > self.max_chunk_cache_size:
+                    self._chunk_entity_cache.popitem(last=False)
+
+            # Duplicates within this call share their first occurrence's result
+            for index, digest in enumerate(digests):
+                if chunk_entities[index] is None:
+                    chunk_entities[index] = chunk_entities[pending[digest]]
+
+        for owner, overlap, entities in zip(owners, overlaps, chunk_entities):
+            entities_per_text[owner].extend(
+                entity for entity in entities if entity["start"] >= overlap
+            )
+
+        return entities_per_text
+
+    def _predict_entities(self, texts: List[str]) -> List[List[Dict]]:
+        """Run the NER model on each text and group its token labels into entities"""
+        results = []
+        for begin in range(0, len(texts), NER_INFERENCE_BATCH):
+            batch_texts = texts[begin:begin + NER_INFERENCE_BATCH]
+            with self._tokenizer_lock:
+                encoded = self.ner_tokenizer(
+                    batch_texts,
+                    padding=True,
+                    truncation=True,
+                    max_length=512,
+                    return_offsets_mapping=True,
+                    return_tensors="pt"
+                )
+            offsets = encoded.pop("offset_mapping").numpy()
+            with torch.inference_mode():
+                logits = self.ner_model(**encoded.to(self.ner_model.device)).logits
+            probabilities = torch.softmax(logits.float(), dim=-1).cpu().numpy()
+
+            labels = probabilities.argmax(-1)
+            scores = probabilities.max(-1)
+            for row, text in enumerate(batch_texts):
+                results.append(self._group_entities(text, labels[row], scores[row], offsets[row]))
+        return results
+
+    def _group_entities(
         self,
         text: str,
-        language: str
-    ) -> List[str]:
-        """Extract medical terms using AI and NER"""
-        try:
-            # Strategy 1: NER Model Analysis
-            ner_entities = await self._process_ner(text)
-            medical_entities = [
-                entity["term"] for entity in ner_entities
-                if entity["confidence"] > 0.7
-            ]
+        labels: np.ndarray,
+        scores: np.ndarray,
+        offsets: np.ndarray
+    ) -> List[Dict]:
+        """Merge adjacent B-/I- tagged tokens into spans, like the pipeline's "simple" aggregation"""
+        # Special and padding tokens have empty spans; "O" tokens end a span
+        tagged = np.flatnonzero((offsets[:, 1] > offsets[:, 0]) & (labels != self._ner_outside_id))
 
-            # Strategy 2: Gemini Medical Analysis
-            prompt = f"""
-            Analyze this text and identify medical terms, symptoms, and conditions.
-            Focus on clinical terminology and patient symptoms.
-            Text: {text}
-            Return only the identified terms as a JSON array.
-            Return empty array if no medical terms found.
-            """
-            response = self.ai_config.model.generate_content(prompt)
-            ai_terms = json.loads(response.text if hasattr(response, 'text') else '[]')
-
-            # Combine and deduplicate terms
-            all_terms = set(medical_entities + ai_terms)
-            
-            # Validate terms through medical context if terms exist
-            if all_terms:
-                validated_terms = self._validate_medical_relevance(all_terms)
-                return list(validated_terms)
-            
-            return list(all_terms)
+        spans = []
+        previous = -2
+        for index in tagged:
+            tag = self.ner_labels[int(labels[index])]
+            begins = tag.startswith("B-")
+            group = tag[2:] if tag[:2] in ("B-", "I-") else tag
+            start, end = offsets[index]
+            if begins or index != previous + 1 or spans[-1]["entity_group"] != group:
+                spans.append({"entity_group": group, "start": int(start), "end": int(end), "scores": []})
+            spans[-1]["end"] = int(end)
+            spans[-1]["scores"].append(scores[index])
+            previous = index
 
-        except Exception as e:
-            logger.debug(f"Medical term extraction note: {str(e)}")
+        return [
+            {
+                "entity_group": span["entity_group"],
+                "score": float(np.mean(span["scores"])),
+                "word": text[span["start"]:span["end"]],
+                "start": span["start"],
+                "end": span["end"]
+            }
+            for span in spans
+        ]
+
+    def _process_entities(self, entities: List[Dict]) -> List[Dict]:
+        """Process and deduplicate entities"""
+        problems = [entity for entity in entities if entity["entity_group"] in _PROBLEM_GROUPS]
+        if not problems:
             return []
 
-    def _validate_medical_relevance(self, terms: Set[str]) -> Set[str]:
+        # Group by lowercase span: a stable sort puts each group's first
+        # occurrence at its start, then reduceat takes per-group maxima
+        words = [entity["word"] for entity in problems]
+        keys = np.char.lower(np.array(words))
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+
+        scores = np.fromiter((entity["score"] for entity in problems), dtype=np.float64, count=len(problems))
+        max_scores = np.maximum.reduceat(scores[order], starts)
+        counts = np.diff(np.r_[starts, len(order)])
+        first_index = order[starts]
+
+        return [
+            {
+                "term": words[first_index[k]],
+                "confidence": float(max_scores[k]),
+                "count": int(counts[k])
+            }
+            for k in np.argsort(first_index)
+        ]
+
+    def _split_text(
+        self,
+        text: Union[str, Iterable[str]],
+        max_length: int = 512
+    ) -> List[Tuple[str, int, int]]:
+        """Split text, or a sequence of messages, into overlapping token windows within the model's limit.
+
+        Returns (chunk, token count, overlap chars) triples; entities starting
+        inside a window's leading overlap were already found by the previous one.
+        """
+        if not isinstance(text, str):
+            text = " ".join(text)
+        with self._tokenizer_lock:
+            offsets = self.ner_tokenizer(
+                text, add_special_tokens=False, return_offsets_mapping=True
+            )["offset_mapping"]
+        if not offsets:
+            return []
+
+        budget = max_length - 2  # room for [CLS] and [SEP]
+        stride = budget - NER_WINDOW_OVERLAP
+        chunks = []
+        for start in range(0, len(offsets), stride):
+            end = min(start + budget, len(offsets))
+            chunk_start = offsets[start][0]
+            overlap = offsets[start + NER_WINDOW_OVERLAP][0] - chunk_start if start else 0
+            chunks.append((text[chunk_start:offsets[end - 1][1]], end - start, overlap))
+            if end == len(offsets):
+                break
+        return chunks
+
+    async def _validate_medical_relevance(self, terms: Set[str]) -> Set[str]:
         """Validate medical relevance of terms using Gemini"""
+        # Terms already judged are answered locally; only new ones reach Gemini
+        known_valid = set()
+        unknown = set()
+        for term in terms:
+            validity = self._term_validity.get(term.lower())
+            if validity is None:
+                unknown.add(term)
+            elif validity:
+                known_valid.add(term)
+        if not unknown:
+            return known_valid
+
         try:
-            prompt = f"""
-            For each term, determine if it is a valid medical term, symptom, or condition.
-            Terms: {list(terms)}
-            Return only the valid medical terms as a JSON array.
-            """
-            response = self.ai_config.model.generate_content(prompt)
-            return set(json.loads(response.text if hasattr(response, 'text') else '[]'))
+            # Sorted so the same set of terms always yields the same prompt
+            prompt = _TERMS_PROMPT.format(terms=sorted(unknown))
+            valid = {term.lower() for term in orjson.loads(await self._generate(prompt))}
         except:
-            return terms
+            return known_valid | unknown
+
+        for term in unknown:
+            key = term.lower()
+            self._term_validity[key] = key in valid
+            self._term_validity.move_to_end(key)
+            if key in valid:
+                known_valid.add(term)
+        while len(self._term_validity) > self.max_term_cache_size:
+            self._term_validity.popitem(last=False)
+        return known_valid
+
+    def _load_term_validity(self) -> OrderedDict:
+        """Load previously judged terms from disk, if configured"""
+        if self.term_cache_path and os.path.exists(self.term_cache_path):
+            try:
+                with open(self.term_cache_path, "rb") as f:
+                    return OrderedDict(orjson.loads(f.read()))
+            except Exception as e:
+                logger.warning(f"Could not load term cache: {str(e)}")
+        return OrderedDict()
         
     
     async def validate_medical_response(self, analysis_text: str, chat_history: List[Dict]) -> Dict:
         """Validate medical response with enhanced error handling and response validation"""
         try:
+            # NER on the analysis runs while Gemini validates it
+            ner_task = asyncio.create_task(self._process_ner(analysis_text))
+
             # Extract and validate medical terms
-            terms = set(re.findall(r'\b\w+\b', analysis_text))
-            validated_terms = self._validate_medical_relevance(terms)
+            terms = {
+                word for word in (w.lower() for w in _WORD_RE.findall(analysis_text))
+                if len(word) > 3 and word not in _STOPWORDS
+            }
+            validated_terms = await self._validate_medical_relevance(terms)
 
             # Prepare structured validation prompt
-            prompt = f"""
-            Analyze and validate this medical consultation:
-
-            ANALYSIS TEXT:
-            {analysis_text}
-
-            CONVERSATION HISTORY:
-            {self._extract_conversation_text(chat_history)}
-
-            VALIDATED MEDICAL TERMS:
-            {list(validated_terms)}
-
-            Provide a detailed validation focusing on:
-            1. Safety concerns and potential risks
-            2. Missing critical medical information
-            3. Required follow-up actions
-            4. Treatment compliance considerations
-
-            Return a JSON object with the following structure:
-            {{
-                "safety_concerns": [],
-                "suggested_improvements": [],
-                "critical_missing_info": [],
-                "follow_up_recommendations": []
-            }}
-            """
+            prompt = _VALIDATION_PROMPT.format(
+                analysis_text=analysis_text,
+                conversation=self._extract_conversation_text(chat_history),
+                terms=sorted(validated_terms)
+            )
 
             # Get AI validation
-            response = self.ai_config.model.generate_content(prompt)
-            response_text = response.text.strip()
-
-            # Process response with enhanced JSON handling
-            validation_result = {}
-            try:
-                # Handle different response formats
-                if '```json' in response_text:
-                    json_text = response_text.split('```json')[1].split('```')[0]
-                elif response_text.startswith('{'):
-                    json_text = response_text
-                else:
-                    json_text = response_text.split('{')[1].rsplit('}', 1)[0]
-                    json_text = '{' + json_text + '}'
-                
-                validation_result = json.loads(json_text)
-
-            except (json.JSONDecodeError, IndexError):
+            validation_result = _parse_json(await self._generate(prompt))
+            if not validation_result:
                 logger.warning("JSON parsing failed, using default structure")
                 validation_result = {
                     "safety_concerns": [],
@@ -373,10 +811,11 @@ class SymptomAnalyzer:
                 }
 
             # Enhance validation with NER results
-            ner_entities = await self._process_ner(analysis_text)
+            ner_entities = await ner_task
+            scores = self._confidence_scores(ner_entities)
             critical_terms = [
-                entity["term"] for entity in ner_entities 
-                if entity["confidence"] > 0.85
+                entity["term"] for entity, critical in zip(ner_entities, scores > 0.85)
+                if critical
             ]
 
             # Construct final response
@@ -387,8 +826,8 @@ class SymptomAnalyzer:
                 "follow_up_recommendations": validation_result.get("follow_up_recommendations", []),
                 "validated_terms": list(validated_terms),
                 "critical_terms": critical_terms,
-                "validation_confidence": sum(entity["confidence"] for entity in ner_entities) / len(ner_entities) if ner_entities else 0.5,
-                "validation_timestamp": datetime.now(timezone.utc).isoformat()
+                "validation_confidence": float(scores.mean()) if scores.size else 0.5,
+                "validation_timestamp": _now_iso()
             }
 
         except Exception as e:
@@ -401,68 +840,79 @@ class SymptomAnalyzer:
                 "validated_terms": list(validated_terms) if 'validated_terms' in locals() else [],
                 "critical_terms": [],
                 "validation_confidence": 0.0,
-                "validation_timestamp": datetime.now(timezone.utc).isoformat()
+                "validation_timestamp": _now_iso()
             }
 
 
 
-    async def _analyze_severity(self, text: str) -> Dict:
+    async def _analyze_severity(
+        self,
+        text: str,
+        ner_entities: Optional[List[Dict]] = None
+    ) -> Dict:
         """Analyze symptom severity using AI"""
         try:
-            prompt = f"""
-            Analyze these symptoms for severity. Return a JSON object with these exact fields:
-            {{
-                "severity_score": (1-10),
-                "urgency_level": "low/medium/high",
-                "key_risk_factors": [],
-                "time_sensitivity": "routine/urgent/emergency"
-            }}
-
-            Text: {text}
-            """
-
-            # Generate and parse response
-            response = self.ai_config.model.generate_content(prompt)
-            response_text = response.text.strip()
-            
-            # Handle potential JSON formatting
-            if not response_text.startswith('{'):
-                response_text = response_text.split('```json')[-1].split('```')[0]
-            
-            severity_analysis = json.loads(response_text)
+            # Repeated symptom texts reuse the earlier Gemini verdict
+            cache_key = "severity:" + hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+            severity_analysis = self._get_cached_analysis(cache_key)
+            if severity_analysis is None:
+                prompt = _SEVERITY_PROMPT.format(text=text)
 
-            # Enhance with NER validation
-            ner_entities = await self._process_ner(text)
-            critical_symptoms = [
-                entity for entity in ner_entities 
-                if entity["confidence"] > 0.8
-            ]
+                # Generate and parse response
+                response = await self.ai_config.model.generate_content_async(prompt)
+                parsed = _parse_json(response.text)
+                if not parsed:
+                    logger.debug("No JSON object in severity response")
+                    return self._get_default_severity()
+                severity_analysis = self._validate_severity(parsed)
+                if severity_analysis is None:
+                    return self._get_default_severity()
+                self._cache_analysis(cache_key, severity_analysis)
 
-            return {
-                "severity_score": int(severity_analysis.get("severity_score", 1)),
-                "urgency_level": severity_analysis.get("urgency_level", "low"),
-                "risk_factors": severity_analysis.get("key_risk_factors", []),
-                "time_sensitivity": severity_analysis.get("time_sensitivity", "routine"),
-                "critical_symptoms": [symptom["term"] for symptom in critical_symptoms],
-                "confidence": sum(entity["confidence"] for entity in critical_symptoms) / len(critical_symptoms) if critical_symptoms else 0.5,
-                "analysis_timestamp": datetime.now(timezone.utc).isoformat()
-            }
+            # Enhance with NER validation (reused when the caller already ran it)
+            if ner_entities is None:
+                ner_entities = await self._process_ner(text)
+            return self._build_severity(severity_analysis, ner_entities)
 
-        except json.JSONDecodeError:
-            logger.debug("Retrying with cleaned response format")
-            return self._get_default_severity()
         except Exception as e:
             logger.error(f"Severity analysis error: {str(e)}")
             return self._get_default_severity()
         
+    def _validate_severity(self, analysis: Dict) -> Optional[Dict]:
+        """Severity fields of a Gemini verdict, or None if they fail the schema"""
+        try:
+            return SeverityResponse.model_validate(analysis).model_dump()
+        except ValidationError as e:
+            logger.warning(f"Invalid severity response: {str(e)}")
+            return None
+
+    def _build_severity(self, severity_analysis: Dict, ner_entities: List[Dict]) -> Dict:
+        """Combine AI severity fields with high-confidence NER symptoms"""
+        scores = self._confidence_scores(ner_entities)
+        critical = scores > 0.8
+        critical_symptoms = [
+            entity for entity, keep in zip(ner_entities, critical)
+            if keep
+        ]
+
+        return {
+            "severity_score": int(severity_analysis.get("severity_score", 1)),
+            "urgency_level": severity_analysis.get("urgency_level", "low"),
+            "risk_factors": severity_analysis.get("key_risk_factors", []),
+            "time_sensitivity": severity_analysis.get("time_sensitivity", "routine"),
+            "critical_symptoms": [symptom["term"] for symptom in critical_symptoms],
+            "confidence": float(scores[critical].mean()) if critical_symptoms else 0.5,
+            "analysis_timestamp": _now_iso()
+        }
+
     async def get_severity_assessment(self, symptoms: List[Dict]) -> Dict:
         """Get severity assessment using existing _analyze_severity method"""
         try:
             # Convert symptoms list to text format for analysis
             symptoms_text = " ".join([symptom.get("term", "") for symptom in symptoms])
             
-            # Use existing severity analysis
-            severity_result = await self._analyze_severity(symptoms_text)
+            # Use existing severity analysis; the symptoms are NER output already
+            severity_result = await self._analyze_severity(symptoms_text, ner_entities=symptoms)
             
             return {
                 "overall_severity": severity_result["severity_score"],
@@ -482,7 +932,7 @@ class SymptomAnalyzer:
             "time_sensitivity": "routine",
             "critical_symptoms": [],
             "confidence": 0.5,
-            "analysis_timestamp": datetime.now(timezone.utc).isoformat()
+            "analysis_timestamp": _now_iso()
         }
 
     def _determine_emergency_level(
@@ -494,6 +944,14 @@ class SymptomAnalyzer:
         # Implement emergency level detection
         return "low"  # Placeholder
 
+    def _confidence_scores(self, entities: List[Dict]) -> np.ndarray:
+        """Collect entity confidences into one array for vectorized reductions"""
+        return np.fromiter(
+            (entity["confidence"] for entity in entities),
+            dtype=np.float32,
+            count=len(entities)
+        )
+
     def _get_fallback_analysis(self) -> Dict:
         """Get fallback analysis for errors"""
         return {
@@ -516,25 +974,14 @@ class SymptomAnalyzer:
         try:
             symptoms_text = " ".join([symptom.get("term", "") for symptom in symptoms])
             
-            prompt = f"""
-            Provide treatment recommendations for these symptoms:
-            {symptoms_text}
-
-            Return a JSON with these exact fields:
-            {{
-                "medications": [],
-                "homeRemedies": []
-            }}
-            """
-
-            response = self.ai_config.model.generate_content(prompt)
-            recommendations = json.loads(response.text)
+            prompt = _TREATMENT_PROMPT.format(symptoms=symptoms_text)
+            recommendations = orjson.loads(await self._generate(prompt))
 
             med_terms = set()
             for med in recommendations.get("medications", []):
                 med_terms.add(med)
             
-            validated_meds = self._validate_medical_relevance(med_terms)
+            validated_meds = await self._validate_medical_relevance(med_terms)
 
             return {
                 "medications": list(validated_meds),
@@ -554,15 +1001,8 @@ class SymptomAnalyzer:
         try:
             symptoms_text = " ".join([symptom.get("term", "") for symptom in symptoms])
             
-            prompt = f"""
-            Based on these symptoms, recommend the most appropriate medical specialist:
-            {symptoms_text}
-            
-            Return only the specialist type as a single string (e.g. 'Cardiologist', 'General Physician', etc.)
-            """
-
-            response = self.ai_config.model.generate_content(prompt)
-            specialist = response.text.strip().strip('"\'')
+            prompt = _SPECIALIST_PROMPT.format(symptoms=symptoms_text)
+            specialist = (await self._generate(prompt)).strip().strip('"\'')
             
             return specialist if specialist else "General Physician"
 
@@ -574,4 +1014,15 @@ class SymptomAnalyzer:
 
     async def cleanup(self):
         """Cleanup resources"""
-        self.thread_pool.shutdown()
\ No newline at end of file
+        if self.term_cache_path:
+            try:
+                with open(self.term_cache_path, "wb") as f:
+                    f.write(orjson.dumps(self._term_validity))
+            except Exception as e:
+                logger.warning(f"Could not save term cache: {str(e)}")
+
+        if self._ner_server_task is not None:
+            self._ner_server_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._ner_server_task
+        self.thread_pool.shutdown(wait=False, cancel_futures=True)
\ No newline at end of file
@@ -4,15 +4,35 @@ from datetime import datetime, timedelta
 from app.config.database import translations_cache, redis_client, DatabaseConfig
 from app.config.language_metadata import LanguageMetadata
 import hashlib
-import json
+import orjson
 import logging
 import asyncio
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from cachetools import TTLCache
+from pymongo import UpdateOne
+from pymongo.errors import AutoReconnect, ServerSelectionTimeoutError
 from collections import defaultdict
+from functools import lru_cache
 import os
+import random
+import time
 
 logger = logging.getLogger(__name__)
 
+# Compound index serving every lookup and upsert by text and language pair
+_TRANSLATION_INDEX = [("source_language", 1), ("target_language", 1), ("source_text", 1)]
+
+@lru_cache(maxsize=512)
+def _language_pair_prefix(prefix: str, source_lang: str, target_lang: str) -> str:
+    """Key prefix shared by all translations of a language pair"""
+    return f"{prefix}{source_lang}:{target_lang}:"
+
+@lru_cache(maxsize=4096)
+def _cache_key(prefix: str, source_lang: str, target_lang: str, text: str) -> str:
+    """Redis key for a translation, memoized for recently seen texts"""
+    text_hash = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    return _language_pair_prefix(prefix, source_lang, target_lang) + text_hash
+
 class CachedTranslation(BaseModel):
     """Model for cached translations"""
     source_text: str = Field(..., description="Original text")
@@ -38,6 +58,24 @@ class CacheStats(BaseModel):
     total_entries: int = 0
     memory_usage: int = 0
 
+_TRANSLATION_LIST = TypeAdapter(List[CachedTranslation])
+
+class CountingSemaphore:
+    """Async semaphore that keeps an explicit count of its current holders"""
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.inflight = 0
+        self._semaphore = asyncio.Semaphore(capacity)
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        self.inflight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.inflight -= 1
+        self._semaphore.release()
+
 class TranslationCache:
     def __init__(self):
         # Cache configuration
@@ -45,6 +83,7 @@ class TranslationCache:
         self._initialized = False
         self._initialization_lock = asyncio.Lock()
         self.cache_duration = timedelta(days=7)
+        self._cache_ttl_seconds = int(self.cache_duration.total_seconds())
         self.redis_prefix = "translation:"
         self.min_confidence_threshold = 0.8
         self.max_text_length = 1000
@@ -53,16 +92,40 @@ class TranslationCache:
         self.batch_size = 50
         self.max_retries = 3
         self.retry_delay = 0.1
-        self.pool_semaphore = asyncio.Semaphore(10)
+        self.max_retry_delay = 1.0
+        self.mongo_lookup_timeout = 0.5  # seconds before a lookup counts as a miss
+        # Bounds concurrent MongoDB operations; Redis concurrency is already
+        # capped by the client's connection pool
+        self.pool_semaphore = CountingSemaphore(10)
+        self.scan_batch_size = 1000  # keys per SCAN page and per pipeline
+        self.memory_sample_size = 200  # random keys measured for memory stats
+
+        # In-process L1 in front of Redis for recently served translations
+        self._local_cache = TTLCache(maxsize=2048, ttl=60)
         
         # Statistics
         self.stats = defaultdict(int)
         self.last_cleanup = datetime.utcnow()
         self.cleanup_interval = timedelta(hours=24)
 
+        # Upserts and access counts per (text, source, target), flushed to
+        # MongoDB in bulk by a background task
+        self._pending_writes: Dict[tuple, Dict] = {}
+        self.max_pending_writes = 10000
+        self._access_buffer = defaultdict(int)
+        self.max_access_buffer = 10000  # distinct keys; further new keys are dropped
+        self.flush_interval = 1  # seconds
+        self._flush_task = None
+
+        # Redis memory pressure (0 below 70% of maxmemory, 1 at 90%) shortens new TTLs
+        self.memory_pressure = 0.0
+        self.memory_check_interval = 60  # seconds
+        self._memory_monitor_task = None
+
         # Database settings
         self.mongodb = None
         self.translations_collection = None
+        self._lookup_hint = None
         self.db_name = os.getenv("DATABASE_NAME", "arogo_bhasini2")
 
     async def initialize(self):
@@ -94,6 +157,12 @@ class TranslationCache:
                 # Test connections
                 await self.redis_client.ping()
                 test_doc = await self.translations_collection.find_one()
+                await self._ensure_indexes()
+
+                if self._flush_task is None or self._flush_task.done():
+                    self._flush_task = asyncio.create_task(self._flush_loop())
+                if self._memory_monitor_task is None or self._memory_monitor_task.done():
+                    self._memory_monitor_task = asyncio.create_task(self._memory_monitor_loop())
                 
                 # Cache settings
                 self.cache_ttl = 3600  # 1 hour
@@ -109,6 +178,24 @@ class TranslationCache:
                 await self._cleanup_failed_init()
                 raise RuntimeError(f"Cache initialization failed: {str(e)}")
 
+    async def _ensure_indexes(self):
+        """Create the lookup index and a TTL index expiring stale translations"""
+        try:
+            await self.translations_collection.create_index(_TRANSLATION_INDEX, unique=True)
+            # Lookups only hint the index once it is known to exist
+            self._lookup_hint = _TRANSLATION_INDEX
+        except Exception as e:
+            self._lookup_hint = None
+            logger.warning(f"Could not create translation lookup index: {str(e)}")
+
+        try:
+            await self.translations_collection.create_index(
+                [("created_at", 1)],
+                expireAfterSeconds=self._cache_ttl_seconds
+            )
+        except Exception as e:
+            logger.warning(f"Could not create translation TTL index: {str(e)}")
+
     async def _cleanup_failed_init(self):
         """Cleanup resources after failed initialization"""
         try:
@@ -145,18 +232,24 @@ class TranslationCache:
             if len(text) > self.max_text_length:
                 return None
 
-            start_time = datetime.utcnow()
+            start_ns = time.perf_counter_ns()
             cache_key = self._generate_cache_key(text, source_lang, target_lang)
 
-            # Try Redis first
-            async with self.pool_semaphore:
-                cached_data = await self.redis_client.get(cache_key)
+            translation = self._local_cache.get(cache_key)
+            if translation is not None:
+                self.stats["hits"] += 1
+                self._update_access_stats(translation, cache_key)
+                return translation
+
+            # Then Redis
+            cached_data = await self.redis_client.get(cache_key)
 
             if cached_data:
                 self.stats["hits"] += 1
-                cached = json.loads(cached_data)
+                cached = orjson.loads(cached_data)
                 translation = CachedTranslation(**cached)
-                await self._update_access_stats(translation, cache_key)
+                self._local_cache[cache_key] = translation
+                self._update_access_stats(translation, cache_key)
                 return translation
 
             # Try MongoDB if not in Redis
@@ -164,11 +257,12 @@ class TranslationCache:
             if mongo_result:
                 self.stats["hits"] += 1
                 translation = CachedTranslation(**mongo_result)
+                self._local_cache[cache_key] = translation
                 await self._cache_in_redis(cache_key, translation)
                 return translation
 
             self.stats["misses"] += 1
-            self._update_response_time(start_time)
+            self._update_response_time(start_ns)
             return None
 
         except Exception as e:
@@ -201,8 +295,7 @@ class TranslationCache:
             )
 
             # Cache in both Redis and MongoDB
-            async with self.pool_semaphore:
-                success = await self._store_translation(cache_entry)
+            success = await self._store_translation(cache_entry)
 
             # Periodic cleanup check
             await self._check_cleanup()
@@ -218,28 +311,32 @@ class TranslationCache:
         translations: List[Dict]
     ) -> Dict[str, bool]:
         """Batch process multiple translations"""
+        # Validate the whole batch in one pass; rows reported invalid are
+        # dropped and the rest validated again
+        try:
+            entries = _TRANSLATION_LIST.validate_python(translations)
+        except ValidationError as e:
+            logger.error(f"Error caching translations: {str(e)}")
+            invalid = {error["loc"][0] for error in e.errors()}
+            entries = _TRANSLATION_LIST.validate_python(
+                [trans for index, trans in enumerate(translations) if index not in invalid]
+            )
+
         results = {}
-        async with self.pool_semaphore:
-            async with self.redis_client.pipeline() as pipe:
-                for trans in translations:
-                    try:
-                        cache_entry = CachedTranslation(**trans)
-                        cache_key = self._generate_cache_key(
-                            cache_entry.source_text,
-                            cache_entry.source_language,
-                            cache_entry.target_language
-                        )
-                        # Add to pipeline
-                        await pipe.setex(
-                            cache_key,
-                            int(self.cache_duration.total_seconds()),
-                            cache_entry.json()
-                        )
-                        results[cache_key] = True
-                    except Exception as e:
-                        logger.error(f"Error caching translation: {str(e)}")
-                        results[cache_key] = False
-                
+        ttl = self._ttl_seconds()
+        # One pipeline per batch_size entries keeps Redis's reply buffer bounded
+        for start in range(0, len(entries), self.batch_size):
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for cache_entry in entries[start:start + self.batch_size]:
+                    cache_key = self._generate_cache_key(
+                        cache_entry.source_text,
+                        cache_entry.source_language,
+                        cache_entry.target_language
+                    )
+                    # Add to pipeline
+                    pipe.setex(cache_key, ttl, orjson.dumps(cache_entry.dict()))
+                    results[cache_key] = True
+
                 # Execute pipeline
                 await pipe.execute()
 
@@ -250,25 +347,31 @@ class TranslationCache:
         source_lang: Optional[str] = None,
         target_lang: Optional[str] = None
     ):
-        """Invalidate cache entries with pattern matching"""
+        """Invalidate cache entries for a language pair, either side, or everything"""
         try:
-            # Build MongoDB query
-            query = {
-                "created_at": {"$lt": datetime.utcnow() - self.cache_duration}
-            }
+            # Expiry is handled by Redis TTLs and the MongoDB TTL index, so this
+            # is only for explicit invalidation
+            query = {}
             if source_lang:
                 query["source_language"] = source_lang
             if target_lang:
                 query["target_language"] = target_lang
 
+            # Drop queued upserts in scope so the next flush does not restore them
+            self._pending_writes = {
+                key: document for key, document in self._pending_writes.items()
+                if not ((not source_lang or key[1] == source_lang) and
+                        (not target_lang or key[2] == target_lang))
+            }
+
             # Remove from MongoDB
-            result = await translations_cache.delete_many(query)
-            logger.info(f"Removed {result.deleted_count} expired translations from MongoDB")
+            result = await self.translations_collection.delete_many(query)
+            logger.info(f"Removed {result.deleted_count} invalidated translations from MongoDB")
 
-            # Clear Redis patterns
+            # Clear Redis patterns; the short-lived L1 is simply emptied
+            self._local_cache.clear()
             pattern = self._get_redis_pattern(source_lang, target_lang)
-            async for key in self.redis_client.scan_iter(pattern):
-                await self.redis_client.delete(key)
+            await self._unlink_matching(pattern)
 
         except Exception as e:
             logger.error(f"Cache invalidation error: {str(e)}")
@@ -276,18 +379,15 @@ class TranslationCache:
     async def get_cache_stats(self) -> Dict:
         """Get comprehensive cache statistics"""
         try:
+            total_entries, language_stats = await self._get_collection_stats()
             stats = CacheStats(
                 hits=self.stats["hits"],
                 misses=self.stats["misses"],
                 avg_response_time=self.stats["avg_response_time"],
-                total_entries=await translations_cache.count_documents({}),
+                total_entries=total_entries,
                 memory_usage=await self._get_memory_usage()
             )
 
-            language_stats = {}
-            for lang in LanguageMetadata.get_supported_languages():
-                language_stats[lang] = await self._get_language_stats(lang)
-
             return {
                 "general": stats.dict(),
                 "languages": language_stats,
@@ -298,12 +398,32 @@ class TranslationCache:
             logger.error(f"Error getting cache stats: {str(e)}")
             return {}
 
+    async def _get_collection_stats(self) -> tuple:
+        """Total entry count and per-source-language stats in one aggregation"""
+        result = await self.translations_collection.aggregate([
+            {"$facet": {
+                "total": [{"$count": "count"}],
+                "languages": [{"$group": {
+                    "_id": "$source_language",
+                    "count": {"$sum": 1},
+                    "avg_confidence": {"$avg": "$confidence"},
+                    "total_access": {"$sum": "$access_count"}
+                }}]
+            }}
+        ]).to_list(length=1)
+        facets = result[0] if result else {"total": [], "languages": []}
+
+        total_entries = facets["total"][0]["count"] if facets["total"] else 0
+        grouped = {group.pop("_id"): group for group in facets["languages"]}
+        language_stats = {
+            lang: grouped.get(lang, {"count": 0, "avg_confidence": 0.0, "total_access": 0})
+            for lang in LanguageMetadata.get_supported_languages()
+        }
+        return total_entries, language_stats
+
     async def optimize_cache(self):
         """Optimize cache storage and performance"""
         try:
-            # Remove expired entries
-            await self.invalidate_cache()
-
             # Get current stats
             stats = await self.get_cache_stats()
 
@@ -318,8 +438,7 @@ class TranslationCache:
 
     def _generate_cache_key(self, text: str, source_lang: str, target_lang: str) -> str:
         """Generate unique and consistent cache key"""
-        text_hash = hashlib.md5(text.encode()).hexdigest()
-        return f"{self.redis_prefix}{source_lang}:{target_lang}:{text_hash}"
+        return _cache_key(self.redis_prefix, source_lang, target_lang, text)
 
     def _should_cache(self, text: str, confidence: float) -> bool:
         """Determine if translation should be cached"""
@@ -338,24 +457,28 @@ class TranslationCache:
                 translation.source_language,
                 translation.target_language
             )
+            self._local_cache.pop(cache_key, None)
+
+            # One model walk serves both the Redis payload and the Mongo document
+            document = translation.dict()
 
             # Store in Redis
             await self.redis_client.setex(
                 cache_key,
-                int(self.cache_duration.total_seconds()),
-                translation.json()
+                self._ttl_seconds(),
+                orjson.dumps(document)
             )
 
-            # Store in MongoDB
-            await self.translations_collection.update_one(
-                {
-                    "source_text": translation.source_text,
-                    "source_language": translation.source_language,
-                    "target_language": translation.target_language
-                },
-                {"$set": translation.dict()},
-                upsert=True
-            )
+            # Queue for MongoDB; a later store of the same text replaces it
+            self._pending_writes[(
+                translation.source_text,
+                translation.source_language,
+                translation.target_language
+            )] = document
+            # Flush early when the queue fills up; a backlog left by a failed
+            # write waits for the periodic flush instead of every store retrying
+            if len(self._pending_writes) == self.batch_size:
+                await self._flush_pending_writes()
 
             return True
 
@@ -363,22 +486,91 @@ class TranslationCache:
             logger.error(f"Error storing translation: {str(e)}")
             return False
 
-    async def _update_access_stats(
+    async def _cache_in_redis(self, cache_key: str, translation: CachedTranslation):
+        """Write a translation back to Redis after a MongoDB hit"""
+        await self.redis_client.setex(
+            cache_key,
+            self._ttl_seconds(),
+            orjson.dumps(translation.dict())
+        )
+
+    def _update_access_stats(
         self,
         translation: CachedTranslation,
         cache_key: str
     ):
-        """Update access statistics"""
+        """Count an access, to be written to MongoDB by the next flush"""
+        translation.access_count += 1
+        key = (translation.source_text, translation.source_language, translation.target_language)
+        # Counts are best effort: if MongoDB falls behind, new keys are
+        # dropped rather than growing the buffer without limit
+        if key in self._access_buffer or len(self._access_buffer) < self.max_access_buffer:
+            self._access_buffer[key] += 1
+        else:
+            self.stats["dropped_access_updates"] += 1
+
+    async def _flush_loop(self):
+        """Periodically write queued upserts and access counts to MongoDB"""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self._flush_pending_writes()
+            await self._flush_access_stats()
+
+    async def _flush_pending_writes(self):
+        """Write queued translations with one unordered bulk upsert"""
+        if not self._pending_writes or self.translations_collection is None:
+            return
+        pending, self._pending_writes = self._pending_writes, {}
         try:
-            translation.access_count += 1
-            await self.translations_collection.update_one(
-                {
-                    "source_text": translation.source_text,
-                    "source_language": translation.source_language,
-                    "target_language": translation.target_language
-                },
-                {"$inc": {"access_count": 1}}
-            )
+            async with self.pool_semaphore:
+                await self.translations_collection.bulk_write(
+                    [
+                        UpdateOne(
+                            {
+                                "source_text": text,
+                                "source_language": source_lang,
+                                "target_language": target_lang
+                            },
+                            {"$set": document},
+                            upsert=True
+                        )
+                        for (text, source_lang, target_lang), document in pending.items()
+                    ],
+                    ordered=False
+                )
+        except Exception as e:
+            logger.error(f"Error storing translations: {str(e)}")
+            # Upserts are idempotent, so the whole batch is retried on the next
+            # flush; entries stored again meanwhile are newer and win
+            for key, document in pending.items():
+                if key in self._pending_writes:
+                    continue
+                if len(self._pending_writes) < self.max_pending_writes:
+                    self._pending_writes[key] = document
+                else:
+                    self.stats["dropped_writes"] += 1
+
+    async def _flush_access_stats(self):
+        """Write buffered access counts with one unordered bulk write"""
+        if not self._access_buffer or self.translations_collection is None:
+            return
+        buffer, self._access_buffer = self._access_buffer, defaultdict(int)
+        try:
+            async with self.pool_semaphore:
+                await self.translations_collection.bulk_write(
+                    [
+                        UpdateOne(
+                            {
+                                "source_text": text,
+                                "source_language": source_lang,
+                                "target_language": target_lang
+                            },
+                            {"$inc": {"access_count": count}}
+                        )
+                        for (text, source_lang, target_lang), count in buffer.items()
+                    ],
+                    ordered=False
+                )
         except Exception as e:
             logger.error(f"Error updating access stats: {str(e)}")
 
@@ -388,19 +580,41 @@ class TranslationCache:
         source_lang: str,
         target_lang: str
     ) -> Optional[Dict]:
-        """Get translation from MongoDB with retry logic"""
+        """Get translation from MongoDB, giving up as a miss past the lookup deadline"""
+        try:
+            return await asyncio.wait_for(
+                self._find_with_retry(text, source_lang, target_lang),
+                self.mongo_lookup_timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning("MongoDB cache lookup timed out")
+            return None
+
+    async def _find_with_retry(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str
+    ) -> Optional[Dict]:
+        """Find a translation, retrying only transient connection errors"""
         for retry in range(self.max_retries):
             try:
-                return await translations_cache.find_one({
-                    "source_text": text,
-                    "source_language": source_lang,
-                    "target_language": target_lang,
-                    "created_at": {"$gte": datetime.utcnow() - self.cache_duration}
-                })
-            except Exception as e:
+                async with self.pool_semaphore:
+                    return await self.translations_collection.find_one(
+                        {
+                            "source_text": text,
+                            "source_language": source_lang,
+                            "target_language": target_lang,
+                            "created_at": {"$gte": datetime.utcnow() - self.cache_duration}
+                        },
+                        hint=self._lookup_hint
+                    )
+            except (AutoReconnect, ServerSelectionTimeoutError):
                 if retry == self.max_retries - 1:
                     raise
-                await asyncio.sleep(self.retry_delay * (retry + 1))
+                # Exponential backoff with jitter so callers don't retry in lockstep
+                delay = min(self.max_retry_delay, self.retry_delay * 2 ** retry)
+                await asyncio.sleep(delay * random.uniform(0.5, 1.5))
 
     async def _check_cleanup(self):
         """Check if cleanup is needed"""
@@ -408,32 +622,86 @@ class TranslationCache:
             asyncio.create_task(self.optimize_cache())
             self.last_cleanup = datetime.utcnow()
 
-    def _update_response_time(self, start_time: datetime):
+    def _update_response_time(self, start_ns: int):
         """Update average response time"""
-        duration = (datetime.utcnow() - start_time).total_seconds()
-        self.stats["avg_response_time"] = (
-            (self.stats["avg_response_time"] * (self.stats["hits"] + self.stats["misses"]) + duration) /
-            (self.stats["hits"] + self.stats["misses"] + 1)
+        duration = (time.perf_counter_ns() - start_ns) * 1e-9
+        self.stats["timed_lookups"] += 1
+        # Incremental mean, stable however many lookups have been timed
+        self.stats["avg_response_time"] += (
+            (duration - self.stats["avg_response_time"]) / self.stats["timed_lookups"]
         )
 
     async def _get_memory_usage(self) -> int:
-        """Get Redis memory usage"""
+        """Estimate Redis memory used by translations from a random key sample"""
         try:
-            pattern = f"{self.redis_prefix}*"
-            memory = 0
-            async for key in self.redis_client.scan_iter(pattern):
-                memory += await self.redis_client.memory_usage(key) or 0
-            return memory
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.dbsize()
+                for _ in range(self.memory_sample_size):
+                    pipe.randomkey()
+                key_count, *sample = await pipe.execute()
+
+            # Scale the sample's mean size by the estimated number of
+            # translation keys in the database
+            sample = set(key for key in sample if key is not None)
+            matching = [key for key in sample if key.startswith(self.redis_prefix)]
+            if not matching:
+                return 0
+            mean_size = await self._sum_memory_usage(matching) / len(matching)
+            return int(mean_size * key_count * len(matching) / len(sample))
         except Exception as e:
             logger.error(f"Error getting memory usage: {str(e)}")
             return 0
 
+    async def _unlink_matching(self, pattern: str) -> int:
+        """Unlink keys matching pattern in batches, returning the number removed"""
+        removed = 0
+        keys = []
+        async for key in self.redis_client.scan_iter(pattern, count=self.scan_batch_size):
+            keys.append(key)
+            if len(keys) >= self.scan_batch_size:
+                removed += await self.redis_client.unlink(*keys)
+                keys = []
+        if keys:
+            removed += await self.redis_client.unlink(*keys)
+        return removed
+
+    def _ttl_seconds(self) -> int:
+        """Redis TTL for new entries, cut by up to 80% under memory pressure"""
+        return int(self._cache_ttl_seconds * (1 - 0.8 * self.memory_pressure))
+
+    async def _memory_monitor_loop(self):
+        """Periodically sample Redis memory pressure"""
+        while True:
+            await self._refresh_memory_pressure()
+            await asyncio.sleep(self.memory_check_interval)
+
+    async def _refresh_memory_pressure(self):
+        """Map used_memory between 70% and 90% of maxmemory onto 0..1"""
+        try:
+            info = await self.redis_client.info("memory")
+            max_memory = int(info.get("maxmemory", 0))
+            if not max_memory:
+                self.memory_pressure = 0.0
+                return
+            low, high = 0.7 * max_memory, 0.9 * max_memory
+            used = int(info.get("used_memory", 0))
+            self.memory_pressure = min(1.0, max(0.0, (used - low) / (high - low)))
+        except Exception as e:
+            logger.warning(f"Error sampling Redis memory: {str(e)}")
+
+    async def _sum_memory_usage(self, keys: List[str]) -> int:
+        """Total MEMORY USAGE of keys in one pipelined round trip"""
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.memory_usage(key)
+            return sum(usage or 0 for usage in await pipe.execute())
+
     async def _get_pool_utilization(self) -> Dict:
         """Get connection pool utilization"""
         try:
             return {
-                "active_connections": len(self.pool_semaphore._waiters) + self.pool_semaphore._value,
-                "available_connections": self.pool_semaphore._value
+                "active_connections": self.pool_semaphore.inflight,
+                "available_connections": self.pool_semaphore.capacity - self.pool_semaphore.inflight
             }
         except Exception as e:
             logger.error(f"Error getting pool utilization: {str(e)}")
@@ -457,11 +725,18 @@ class TranslationCache:
     async def cleanup(self):
         """Clean up translation cache resources"""
         try:
+            for task in (self._flush_task, self._memory_monitor_task):
+                if task is not None:
+                    task.cancel()
+            self._flush_task = None
+            self._pending_writes = {}
+            self._memory_monitor_task = None
+            self._access_buffer = defaultdict(int)
+            self._local_cache.clear()
+
             # Clear Redis cache
             if self.redis_client is not None:
-                pattern = f"{self.redis_prefix}*"
-                async for key in self.redis_client.scan_iter(pattern):
-                    await self.redis_client.delete(key)
+                await self._unlink_matching(f"{self.redis_prefix}*")
                 logger.info("Redis translation cache cleared")
                 
             # Clear MongoDB cache - Fixed comparison